@@ -15,7 +15,7 @@
 # -----------------------------
 
 # Importa typing para anotar tipos de manera clara y mantenible.
-from typing import Callable, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 # Importa os para operaciones de sistema como rutas y variables de entorno.
 import os
@@ -23,6 +23,9 @@ import os
 # Importa sys para acceder a información del intérprete y salida de errores.
 import sys
 
+# Importa Path para manipular rutas de archivo sin reanalizar cadenas.
+from pathlib import Path
+
 # Importa shutil para localizar binarios en PATH y gestionar archivos.
 import shutil
 
@@ -38,24 +41,39 @@ import platform
 # Importa re para validaciones y parsing de rangos de páginas.
 import re
 
+# Importa time para espaciar en el tiempo las notificaciones a la interfaz.
+import time
+
+# Importa asyncio para lanzar varios procesos de Tesseract en paralelo sin bloquear por página.
+import asyncio
+
+# Importa un ejecutor de hilos para renderizar páginas fuera del bucle de eventos.
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Importa codecs para decodificar de forma incremental la salida binaria de OCRmyPDF.
+import codecs
+
+# Importa functools para memorizar resultados de búsquedas repetidas.
+import functools
+
+# Importa threading para proteger el progreso compartido entre bloques de OCRmyPDF.
+import threading
+
 
 # -----------------------------
 # Importaciones de terceros
 # -----------------------------
 
-# Importa fitz (PyMuPDF) para abrir y renderizar páginas de PDF a imagen.
+# Importa fitz (PyMuPDF) para abrir, renderizar y unir páginas de PDF.
 import fitz  # type: ignore
 
-# Importa PdfMerger de pypdf para unir PDFs intermedios.
-from pypdf import PdfMerger  # type: ignore
-
 
 # -----------------------------
 # Importaciones de PyQt6
 # -----------------------------
 
 # Importa el núcleo de PyQt6 para señales, ranuras y temporizadores.
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 
 # Importa widgets de PyQt6 para construir la interfaz gráfica.
 from PyQt6.QtWidgets import (
@@ -80,14 +98,119 @@ from PyQt6.QtWidgets import (
 )
 
 
+# -----------------------------
+# Constantes
+# -----------------------------
+
+# Patrón precompilado para rangos de páginas del tipo 'a-b', 'a-' o '-b'.
+_RANGE_RE = re.compile(r"^(\d+)?\s*-\s*(\d+)?$")
+
+# Patrón precompilado para las líneas de progreso "page X of Y" / "Page X of Y" que emite OCRmyPDF.
+_PROGRESS_RE = re.compile(r"[Pp]age\s+(\d+)\s+of\s+(\d+)")
+
+# Tamaño de cada lectura de la salida de OCRmyPDF (bytes).
+PIPE_READ_SIZE = 65536
+
+# Directorio en memoria (tmpfs) preferido en Linux para los bloques intermedios de OCRmyPDF.
+SHM_DIR = "/dev/shm"
+
+# Espacio libre mínimo en el tmpfs para usarlo; por debajo se recurre al temporal del sistema.
+SHM_MIN_FREE_BYTES = 512 * 1024 * 1024
+
+# Modelos de Tesseract seleccionables: 'fast' (más rápido) o 'best' (más preciso); 'default' usa los del sistema.
+OCR_QUALITY_OPTIONS = [
+    ("Rápida (tessdata_fast)", "fast"),
+    ("Precisa (tessdata_best)", "best"),
+    ("Predeterminada del sistema", "default"),
+]
+
+# Directorios habituales donde las distribuciones instalan los modelos de Tesseract.
+TESSDATA_SEARCH_DIRS = [
+    "/usr/share/tesseract-ocr/5",
+    "/usr/share/tesseract-ocr/4.00",
+    "/usr/share",
+    "/usr/local/share",
+    "/opt/homebrew/share",
+    r"C:\Program Files\Tesseract-OCR",
+]
+
+# Intervalo mínimo (segundos) entre envíos agrupados de log desde el fallback a la interfaz.
+LOG_FLUSH_INTERVAL = 0.25
+
+# Intervalo mínimo (segundos) entre actualizaciones de progreso de OCRmyPDF (como mucho 10 por segundo).
+PROGRESS_MIN_INTERVAL = 0.1
+
+# Intervalo (milisegundos) con el que la ventana vuelca al área de log las líneas acumuladas.
+LOG_UI_FLUSH_MS = 50
+
+# Mínimo de caracteres extraíbles para considerar que una página ya tiene capa de texto (PDF digital).
+TEXT_LAYER_MIN_CHARS = 50
+
+# Nombres del ejecutable de Ghostscript según la plataforma (se evalúa una sola vez al importar).
+GS_CANDIDATES = ("gswin64c", "gswin32c") if platform.system() == "Windows" else ("gs",)
+
+# Opciones de arranque de los procesos externos: en Windows sin ventana de consola (CREATE_NO_WINDOW)
+# y en POSIX en su propia sesión, para que las señales del terminal no lleguen a OCRmyPDF a medio trabajo.
+SUBPROCESS_KWARGS: Dict[str, object] = (
+    {"creationflags": 0x08000000} if platform.system() == "Windows" else {"start_new_session": True}
+)
+
+# Páginas mínimas por bloque al repartir un documento grande entre varios procesos de OCRmyPDF.
+OCRMYPDF_CHUNK_MIN_PAGES = 40
+
+# Plantilla de la etiqueta de estado de motores; los campos coinciden con las claves de probe_engines().
+_STATUS_TPL = "ocrmypdf: {ocrmypdf}   tesseract: {tesseract}   ghostscript: {ghostscript}   qpdf: {qpdf}"
+
+# Marcas de la etiqueta de estado para motor disponible y no disponible.
+_OK_MARK = "✔"
+_MISSING_MARK = "✖"
+
+# Texto del manual de usuario (se construye una sola vez al importar el módulo).
+_MANUAL_TEXT = (
+    "Manual de usuario – OCR PDF GUI\n\n"
+    "1) PDF de entrada: Selecciona el archivo PDF escaneado que deseas convertir.\n"
+    "2) PDF de salida: Ubicación y nombre del PDF con OCR que se generará.\n"
+    "3) Idioma(s) OCR: Despliegue y marca uno o varios idiomas (puedes abrir y marcar "
+    "varias veces). Códigos: Español(spa), Inglés(eng), Alemán(deu), Francés(fra). "
+    "Selecciona los que se correspondan con el idioma del documento para mejorar la precisión.\n"
+    "4) Limpiar fondo/ruido: Con OCRmyPDF elimina ruido y fondos grises; mejora legibilidad.\n"
+    "5) Rotar páginas automáticamente: Detecta y corrige orientación incorrecta.\n"
+    "6) Enderezar (deskew): Corrige inclinaciones leves derivadas del escaneo.\n"
+    "7) Forzar Tesseract por página: Si marcas esto, ignorará OCRmyPDF y usará el modo fallback "
+    "(renderizado de páginas + Tesseract). Útil si no tienes OCRmyPDF instalado.\n"
+    "8) DPI (fallback): Resolución de renderizado para el modo Tesseract por página. 300–400 "
+    "suele equilibrar calidad y tamaño. Las páginas se renderizan en escala de grises (más rápido); "
+    "marca 'Conservar color' si el PDF final debe mantener el color.\n"
+    "9) Hilos (jobs): Paraleliza el proceso (OCRmyPDF y fallback). No abuses si tu equipo va justo.\n"
+    "10) Nº de páginas / rangos: Puedes limitar a un subset. Formatos válidos: '1-100,150,200-'. "
+    "Vacío = todas las páginas. Los rangos abiertos (como '200-') usan el total detectado.\n"
+    "11) Salida PDF/A (OCRmyPDF): Genera un PDF/A para archivo a largo plazo. Es bastante más lento, "
+    "porque la conversión final con Ghostscript usa un solo núcleo; déjalo desmarcado si no lo necesitas.\n"
+    "12) Calidad OCR: 'Rápida' usa los modelos tessdata_fast (aprox. el doble de rápido), 'Precisa' los "
+    "tessdata_best. Si la carpeta no está instalada (o definida con TESSDATA_FAST_PREFIX / "
+    "TESSDATA_BEST_PREFIX), se usan los modelos del sistema.\n\n"
+    "Motores y dependencias:\n"
+    "- OCRmyPDF (recomendado): requiere 'tesseract', 'ghostscript' y 'qpdf'.\n"
+    "- Fallback Tesseract por página: requiere 'tesseract' y PyMuPDF.\n\n"
+    "Buenas prácticas:\n"
+    "- Si el documento es muy antiguo o con latinismos, combina idiomas, p. ej. 'spa+lat' "
+    "(debes tener el idioma instalado en Tesseract). En la app, los idiomas predefinidos son spa/eng/deu/fra.\n"
+    "- Empieza con un rango pequeño para validar calidad antes de procesar todo.\n"
+    "- Conserva siempre el PDF original sin OCR como respaldo.\n"
+)
+
+
 # -----------------------------
 # Utilidades y helpers
 # -----------------------------
 
-# Define una función para localizar un ejecutable en el PATH del sistema.
+# Define una función para localizar un ejecutable en el PATH del sistema (con caché).
+@functools.lru_cache(maxsize=None)
 def which(cmd: str) -> Optional[str]:
     """
     Devuelve la ruta absoluta al ejecutable si se encuentra en PATH.
+    El resultado se memoriza para no recorrer PATH en cada comprobación; usa
+    'which.cache_clear()' para forzar una nueva búsqueda.
     :param cmd: Nombre del comando a localizar (p. ej. 'tesseract', 'ocrmypdf').
     :return: Ruta absoluta si se encuentra; None en caso contrario.
     """
@@ -95,6 +218,95 @@ def which(cmd: str) -> Optional[str]:
     return shutil.which(cmd)
 
 
+# Capacidades del sistema ya comprobadas (herramientas disponibles); se vacía con '_CAPS.clear()'.
+_CAPS: Dict[str, bool] = {}
+# Cerrojo que evita que varios hilos (p. ej. los bloques de OCRmyPDF) lancen la misma comprobación a la vez.
+_CAPS_LOCK = threading.Lock()
+
+
+# Define una función para consultar (y memorizar) si una herramienta está disponible.
+def _has(name: str) -> bool:
+    """
+    Indica si la herramienta 'name' está en PATH, memorizando la respuesta en _CAPS.
+    :param name: Nombre del ejecutable (p. ej. 'unpaper').
+    :return: True si está disponible.
+    """
+    # Consulta PATH solo la primera vez.
+    if name not in _CAPS:
+        _CAPS[name] = which(name) is not None
+    # Devuelve la respuesta memorizada.
+    return _CAPS[name]
+
+
+# Define una función para saber si la versión instalada de OCRmyPDF admite una opción.
+def _ocrmypdf_has_option(option: str) -> bool:
+    """
+    Comprueba en 'ocrmypdf --help' si la opción existe, memorizando la respuesta en _CAPS
+    para no relanzar OCRmyPDF en cada ejecución.
+    :param option: Opción de línea de comandos (p. ej. '--tesseract-thread-limit').
+    :return: True si la ayuda de OCRmyPDF la menciona.
+    """
+    # Clave de la capacidad dentro de _CAPS.
+    key = f"ocrmypdf {option}"
+    # Consulta la ayuda solo la primera vez; el resto de hilos espera a esa respuesta.
+    with _CAPS_LOCK:
+        if key not in _CAPS:
+            try:
+                help_text = subprocess.run(["ocrmypdf", "--help"], capture_output=True, text=True,
+                                           timeout=30, **SUBPROCESS_KWARGS).stdout
+            except (OSError, subprocess.SubprocessError):
+                # Si OCRmyPDF no se puede ejecutar, se asume que la opción no está disponible.
+                help_text = ""
+            _CAPS[key] = option in help_text
+        # Devuelve la respuesta memorizada.
+        return _CAPS[key]
+
+
+# Define una función para localizar Ghostscript con el nombre que usa la plataforma actual.
+def find_ghostscript() -> Optional[str]:
+    """
+    Busca el primer ejecutable de Ghostscript disponible entre GS_CANDIDATES.
+    :return: Ruta absoluta al ejecutable o None si no está instalado.
+    """
+    # Devuelve la primera coincidencia en PATH (las búsquedas quedan en la caché de 'which').
+    return next((path for path in map(which, GS_CANDIDATES) if path), None)
+
+
+# Define una función para comprobar de una vez qué motores y dependencias están instalados.
+def probe_engines() -> Dict[str, bool]:
+    """
+    Comprueba la presencia de 'ocrmypdf', 'tesseract', Ghostscript y 'qpdf' en PATH.
+    :return: Diccionario nombre -> disponible, en el orden en que se muestran en la interfaz.
+    """
+    # Resuelve cada dependencia mediante la caché de 'which'.
+    return {
+        "ocrmypdf": which("ocrmypdf") is not None,
+        "tesseract": which("tesseract") is not None,
+        "ghostscript": find_ghostscript() is not None,
+        "qpdf": which("qpdf") is not None,
+    }
+
+
+# Define una función para obtener una huella barata del estado de los directorios de PATH.
+def path_fingerprint() -> Tuple[Tuple[str, Optional[int]], ...]:
+    """
+    Devuelve cada directorio de PATH con su fecha de modificación. Instalar o borrar un
+    ejecutable cambia la fecha de su directorio, así que si la huella no cambia no hace falta
+    volver a buscar los motores.
+    :return: Tupla de pares (directorio, mtime en ns o None si no existe).
+    """
+    # Prepara la lista de pares directorio/fecha.
+    stamps: List[Tuple[str, Optional[int]]] = []
+    # Consulta un único stat por directorio de PATH.
+    for d in os.environ.get("PATH", "").split(os.pathsep):
+        try:
+            stamps.append((d, os.stat(d).st_mtime_ns))
+        except OSError:
+            stamps.append((d, None))
+    # Devuelve la huella inmutable para poder compararla.
+    return tuple(stamps)
+
+
 # Define una función para lanzar una excepción clara cuando una precondición no se cumple.
 def ensure(condition: bool, message: str) -> None:
     """
@@ -107,27 +319,157 @@ def ensure(condition: bool, message: str) -> None:
         raise RuntimeError(message)
 
 
-# Define una función para convertir un string de rangos de páginas en una lista de enteros base-1.
-def parse_pages(pages_str: Optional[str], total_pages: Optional[int] = None) -> List[int]:
+# Define una función para ordenar y fusionar intervalos de páginas solapados o contiguos.
+def merge_intervals(intervals: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Normaliza una colección de intervalos cerrados de páginas (base-1).
+    :param intervals: Intervalos (inicio, fin) en cualquier orden, posiblemente solapados.
+    :return: Intervalos ordenados, sin solapes y con los contiguos fusionados.
+    """
+    # Prepara la lista de intervalos fusionados.
+    merged: List[Tuple[int, int]] = []
+    # Recorre los intervalos ordenados por inicio.
+    for start, end in sorted(intervals):
+        # Si solapa o es contiguo con el último, amplía el último intervalo.
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            # En caso contrario, abre un nuevo intervalo.
+            merged.append((start, end))
+    # Devuelve los intervalos normalizados.
+    return merged
+
+
+# Define una función para recorrer una a una las páginas de una lista de intervalos.
+def iter_pages(intervals: Iterable[Tuple[int, int]]) -> Iterator[int]:
+    """
+    Genera las páginas (base-1) contenidas en los intervalos, sin materializar una lista.
+    :param intervals: Intervalos cerrados (inicio, fin).
+    :return: Iterador de números de página.
+    """
+    # Recorre cada intervalo y produce sus páginas en orden.
+    for start, end in intervals:
+        yield from range(start, end + 1)
+
+
+# Define una función para contar las páginas de una lista de intervalos.
+def count_pages(intervals: Iterable[Tuple[int, int]]) -> int:
+    """
+    Cuenta las páginas contenidas en una lista de intervalos cerrados sin solapes.
+    :param intervals: Intervalos cerrados (inicio, fin).
+    :return: Número total de páginas.
+    """
+    # Suma la longitud de cada intervalo.
+    return sum(end - start + 1 for start, end in intervals)
+
+
+# Define una función para recortar intervalos a un bloque de páginas y renumerarlos desde 1.
+def clip_intervals(intervals: Iterable[Tuple[int, int]], start: int, end: int) -> List[Tuple[int, int]]:
+    """
+    Devuelve la parte de los intervalos que cae dentro del bloque [start, end], con las páginas
+    renumeradas relativas al bloque (la página 'start' pasa a ser la 1).
+    :param intervals: Intervalos cerrados (inicio, fin) ordenados y sin solapes.
+    :param start: Primera página del bloque (base-1).
+    :param end: Última página del bloque (base-1).
+    :return: Intervalos relativos al bloque; lista vacía si no hay intersección.
+    """
+    # Prepara los intervalos recortados.
+    clipped: List[Tuple[int, int]] = []
+    # Recorre cada intervalo y conserva solo su intersección con el bloque.
+    for a, b in intervals:
+        lo, hi = max(a, start), min(b, end)
+        if lo <= hi:
+            clipped.append((lo - start + 1, hi - start + 1))
+    # Devuelve los intervalos renumerados.
+    return clipped
+
+
+# Define una función para ajustar la selección de páginas al tamaño real del documento.
+def fit_pages_to_document(intervals: List[Tuple[int, int]], total_pages: int) -> List[Tuple[int, int]]:
+    """
+    Valida los intervalos contra el documento: la página 0 es un error y las páginas posteriores
+    a la última se descartan (como un rango abierto hasta el final).
+    :param intervals: Intervalos cerrados (inicio, fin) ordenados y sin solapes.
+    :param total_pages: Número total de páginas del documento.
+    :return: Intervalos recortados a [1, total_pages].
+    """
+    # Rechaza páginas menores que 1, que PyMuPDF interpretaría como índices desde el final.
+    for start, _end in intervals:
+        ensure(start >= 1, f"Página fuera de rango: {start}")
+    # Recorta los intervalos al documento (con inicio 1 la numeración no cambia).
+    fitted = clip_intervals(intervals, 1, total_pages)
+    # Exige que quede al menos una página por procesar.
+    ensure(bool(fitted), f"Ninguna de las páginas seleccionadas existe: el documento tiene {total_pages}.")
+    # Devuelve los intervalos válidos.
+    return fitted
+
+
+# Define una función para decidir cómo repartir un documento grande entre varios OCRmyPDF.
+def plan_ocrmypdf_chunks(pages: List[Tuple[int, int]],
+                         total_pages: int,
+                         jobs: int,
+                         min_pages: int = OCRMYPDF_CHUNK_MIN_PAGES) -> List[Tuple[int, int]]:
+    """
+    Divide el documento en bloques contiguos, uno por proceso de OCRmyPDF, de modo que cada uno
+    reciba un número similar de páginas seleccionadas (al menos 'min_pages', para amortizar el
+    arranque de OCRmyPDF). Los bloques cubren todo el documento: las páginas no seleccionadas
+    viajan con el bloque que las contiene.
+    :param pages: Intervalos (inicio, fin) base-1 de páginas seleccionadas, ordenados y sin solapes.
+    :param total_pages: Número total de páginas del documento.
+    :param jobs: Número máximo de procesos en paralelo.
+    :param min_pages: Páginas seleccionadas mínimas por bloque.
+    :return: Bloques (inicio, fin) base-1; lista vacía si no compensa dividir.
+    """
+    # Calcula cuántos bloques caben respetando el tamaño mínimo y el límite de procesos.
+    selected = count_pages(pages)
+    n_chunks = min(jobs, selected // max(1, min_pages))
+    # Con menos de dos bloques no hay nada que paralelizar.
+    if n_chunks < 2:
+        return []
+    # Reparte las páginas seleccionadas de forma equilibrada (los primeros bloques absorben el resto).
+    size, extra = divmod(selected, n_chunks)
+    # Cierra cada bloque en la última página seleccionada que le corresponde.
+    chunks: List[Tuple[int, int]] = []
+    start = 1
+    quota = size + (1 if extra else 0)
+    for pn in iter_pages(pages):
+        quota -= 1
+        if quota == 0 and len(chunks) < n_chunks - 1:
+            chunks.append((start, pn))
+            start = pn + 1
+            quota = size + (1 if len(chunks) < extra else 0)
+    # El último bloque se extiende hasta el final del documento.
+    chunks.append((start, total_pages))
+    # Devuelve los bloques calculados.
+    return chunks
+
+
+# Define una función para convertir un string de rangos de páginas en intervalos base-1.
+def parse_pages(pages_str: Optional[str], total_pages: Optional[int] = None) -> List[Tuple[int, int]]:
     """
     Parsea un string de rangos de páginas (base-1) permitiendo formatos como:
       - '1-10, 15, 20-' (este último hasta el final si se conoce total_pages)
       - '-' no es válido en solitario
+    Los rangos se mantienen como intervalos cerrados para no expandir '1-10000' en memoria.
     :param pages_str: Cadena con rangos separados por comas.
     :param total_pages: Número total de páginas para interpretar rangos abiertos.
-    :return: Lista deduplicada de páginas (enteros base-1) ordenadas ascendentemente.
+    :return: Intervalos (inicio, fin) ordenados ascendentemente, sin solapes.
     """
     # Si no se pasa cadena, retorna lista vacía que indica "todas las páginas".
     if not pages_str:
         return []
     # Separa por comas y limpia espacios.
     parts = [p.strip() for p in pages_str.split(",") if p.strip()]
-    # Prepara resultado acumulado.
-    result: List[int] = []
+    # Prepara los intervalos acumulados.
+    result: List[Tuple[int, int]] = []
     # Recorre cada parte del rango.
     for part in parts:
+        # Vía rápida: un número suelto no necesita pasar por la expresión regular.
+        if part.isdigit():
+            result.append((int(part), int(part)))
+            continue
         # Intenta hacer match de formato rango "a-b".
-        m = re.match(r"^(\d+)?\s*-\s*(\d+)?$", part)
+        m = _RANGE_RE.match(part)
         # Si hay match, es un rango.
         if m:
             # Recupera valores capturados (inicio y fin).
@@ -142,145 +484,345 @@ def parse_pages(pages_str: Optional[str], total_pages: Optional[int] = None) ->
             # Si el fin es menor que inicio, intercambia para normalizar.
             if end < start:
                 start, end = end, start
-            # Añade todos los enteros del rango inclusivo.
-            result.extend(list(range(start, end + 1)))
+            # Añade el intervalo cerrado sin expandirlo.
+            result.append((start, end))
         else:
-            # Si no es rango, debe ser un número suelto; valida.
-            if part.isdigit():
-                # Convierte a entero y añade al resultado.
-                result.append(int(part))
-            else:
-                # Lanza error en formato no reconocido.
-                raise ValueError(f"Formato de páginas no reconocido: '{part}'")
-    # Deduplica manteniendo el orden de aparición.
-    seen = set()
-    deduped: List[int] = []
-    for p in result:
-        if p not in seen:
-            deduped.append(p)
-            seen.add(p)
-    # Devuelve la lista final de páginas.
-    return deduped
-
-
-# Define una función para convertir una lista de páginas a representación de rangos compactos.
-def pages_to_ranges(nums: List[int]) -> str:
-    """
-    Convierte una lista de páginas (enteros base-1) en una cadena compacta de rangos.
-    :param nums: Lista de páginas.
+            # Si no es rango ni número suelto, lanza error de formato no reconocido.
+            raise ValueError(f"Formato de páginas no reconocido: '{part}'")
+    # Ordena, deduplica y fusiona los intervalos.
+    return merge_intervals(result)
+
+
+# Define una función para convertir páginas o intervalos a representación de rangos compactos.
+def pages_to_ranges(nums: Sequence[Union[int, Tuple[int, int]]]) -> str:
+    """
+    Convierte una lista de páginas (enteros base-1) o de intervalos (inicio, fin) en una cadena
+    compacta de rangos.
+    :param nums: Lista de páginas o de intervalos cerrados.
     :return: Cadena tipo '1-5,7,10-12'.
     """
     # Si la lista está vacía, retorna cadena vacía.
     if not nums:
         return ""
-    # Ordena y deduplica por seguridad.
-    nums = sorted(set(nums))
-    # Prepara contenedores para construir rangos.
-    ranges: List[str] = []
-    # Inicializa inicio y anterior.
-    start = prev = nums[0]
-    # Recorre valores restantes.
-    for n in nums[1:]:
-        if n == prev + 1:
-            # Si es consecutivo, avanza el final del rango.
-            prev = n
-        else:
-            # Si se rompe la consecutividad, cierra el rango actual.
-            if start == prev:
-                ranges.append(f"{start}")
-            else:
-                ranges.append(f"{start}-{prev}")
-            # Reinicia inicio y anterior.
-            start = prev = n
-    # Cierra el último rango.
-    if start == prev:
-        ranges.append(f"{start}")
-    else:
-        ranges.append(f"{start}-{prev}")
-    # Une con comas y devuelve.
-    return ",".join(ranges)
+    # Convierte cada página suelta en un intervalo de una página y fusiona consecutivos.
+    intervals = merge_intervals((n, n) if isinstance(n, int) else n for n in nums)
+    # Formatea cada intervalo como 'a' o 'a-b', los une con comas y devuelve.
+    return ",".join(f"{start}" if start == end else f"{start}-{end}" for start, end in intervals)
 
 
-# Define una función para renderizar una página de PDF a imagen mediante PyMuPDF.
-def render_page_to_image(pdf_path: str, page_number_1based: int, dpi: int, tmpdir: str) -> str:
+# Define una función para proponer la ruta de salida a partir de la de entrada.
+def suggest_output_path(in_path: str) -> str:
     """
-    Renderiza una página de un PDF a PNG usando PyMuPDF (fitz).
-    :param pdf_path: Ruta al PDF de entrada.
+    Propone un PDF de salida en la misma carpeta que la entrada, con sufijo '_OCR.pdf'.
+    :param in_path: Ruta del PDF de entrada.
+    :return: Ruta sugerida para el PDF con OCR.
+    """
+    # Sustituye el nombre manteniendo la carpeta del original.
+    p = Path(in_path)
+    return str(p.with_name(p.stem + "_OCR.pdf"))
+
+
+# Define una función para elegir dónde crear los directorios temporales de trabajo.
+def fast_temp_dir(min_free_bytes: int = SHM_MIN_FREE_BYTES) -> Optional[str]:
+    """
+    Devuelve un directorio tmpfs (RAM) para los ficheros intermedios cuando es posible.
+    Solo se usa en Linux, si '/dev/shm' es escribible y tiene espacio holgado (en contenedores
+    suele ser muy pequeño).
+    :param min_free_bytes: Espacio libre mínimo exigido; conviene escalarlo con el tamaño de los datos.
+    :return: Ruta a '/dev/shm' o None para usar el directorio temporal por defecto del sistema.
+    """
+    # Descarta sistemas distintos de Linux y tmpfs inexistentes o sin permisos.
+    if platform.system() != "Linux" or not os.access(SHM_DIR, os.W_OK | os.X_OK):
+        return None
+    # Comprueba que el tmpfs tiene espacio suficiente para los PDFs intermedios.
+    try:
+        free = shutil.disk_usage(SHM_DIR).free
+    except OSError:
+        return None
+    # Devuelve el tmpfs solo si supera el mínimo de espacio libre.
+    return SHM_DIR if free >= min_free_bytes else None
+
+
+# Define una función para renderizar una página de PDF a un pixmap de PyMuPDF.
+def render_page_pixmap(doc: "fitz.Document", page_number_1based: int, dpi: int,
+                       grayscale: bool = True) -> "fitz.Pixmap":
+    """
+    Renderiza una página de un PDF a un pixmap (bitmap en memoria) usando PyMuPDF (fitz).
+    Por defecto se renderiza en escala de grises (1 byte por píxel frente a 3 en RGB), ya que
+    Tesseract convierte a grises internamente y el color no mejora el reconocimiento.
+    :param doc: Documento PyMuPDF ya abierto (se reutiliza entre páginas para no reparsearlo).
     :param page_number_1based: Número de página base-1 a renderizar.
     :param dpi: Resolución objetivo (recomendado 300-400).
-    :param tmpdir: Directorio temporal donde guardar la imagen.
-    :return: Ruta absoluta al PNG generado.
-    """
-    # Calcula la matriz de zoom en función de DPI (72 es la base de PDF).
-    zoom = dpi / 72.0
-    # Crea la matriz de transformación con el zoom indicado.
-    mat = fitz.Matrix(zoom, zoom)
-    # Abre el documento PDF con PyMuPDF.
-    with fitz.open(pdf_path) as doc:
-        # Valida que la página solicitada está dentro de rango.
-        ensure(1 <= page_number_1based <= len(doc), f"Página fuera de rango: {page_number_1based}")
-        # Obtiene el objeto página (PyMuPDF es 0-based internamente).
-        page = doc[page_number_1based - 1]
-        # Renderiza el contenido a un pixmap (bitmap en memoria).
-        pix = page.get_pixmap(matrix=mat, alpha=False)
-        # Define la ruta de salida en el directorio temporal.
-        out_path = os.path.join(tmpdir, f"page_{page_number_1based:06d}.png")
-        # Guarda la imagen como PNG sin canal alfa.
-        pix.save(out_path)
-        # Devuelve la ruta generada.
-        return out_path
-
-
-# Define una función para aplicar Tesseract a una imagen y producir un PDF buscable.
-def tesseract_ocr_image_to_pdf(image_path: str, out_dir: str, lang: str) -> str:
-    """
-    Ejecuta Tesseract sobre una imagen y genera un PDF con capa de texto.
-    :param image_path: Ruta a la imagen (PNG) de la página.
-    :param out_dir: Directorio temporal donde depositar el resultado.
+    :param grayscale: Si es False, conserva el color (RGB) en la imagen y en el PDF resultante.
+    :return: Pixmap de la página sin canal alfa.
+    """
+    # Valida que la página solicitada está dentro de rango.
+    ensure(1 <= page_number_1based <= len(doc), f"Página fuera de rango: {page_number_1based}")
+    # Obtiene el objeto página (PyMuPDF es 0-based internamente).
+    page = doc[page_number_1based - 1]
+    # Renderiza el contenido al DPI indicado, en grises o en color.
+    return page.get_pixmap(dpi=dpi, alpha=False, colorspace=fitz.csGRAY if grayscale else fitz.csRGB)
+
+
+# Define una función para renderizar una página de PDF a imagen en memoria mediante PyMuPDF.
+def render_page_to_image(doc: "fitz.Document", page_number_1based: int, dpi: int,
+                         grayscale: bool = True) -> bytes:
+    """
+    Renderiza una página de un PDF a imagen PNM en memoria usando PyMuPDF (fitz).
+    PNM no lleva compresión, por lo que se evita tanto el coste de codificar PNG como
+    la escritura a disco: la imagen se entrega directamente a Tesseract por stdin.
+    :param doc: Documento PyMuPDF ya abierto (se reutiliza entre páginas para no reparsearlo).
+    :param page_number_1based: Número de página base-1 a renderizar.
+    :param dpi: Resolución objetivo (recomendado 300-400).
+    :param grayscale: Si es False, conserva el color (RGB) en la imagen y en el PDF resultante.
+    :return: Bytes de la imagen en formato PNM (PGM en grises, PPM en color).
+    """
+    # Devuelve la imagen serializada como PNM sin comprimir.
+    return render_page_pixmap(doc, page_number_1based, dpi, grayscale).tobytes("pnm")
+
+
+# Define una función para saber si PyMuPDF puede aplicar OCR dentro del propio proceso.
+def supports_in_process_ocr() -> bool:
+    """
+    Indica si la versión instalada de PyMuPDF expone Pixmap.pdfocr_tobytes y get_tessdata.
+    :return: True si el OCR en proceso está disponible.
+    """
+    # Comprueba la presencia del método en la clase Pixmap y del localizador de modelos.
+    return hasattr(getattr(fitz, "Pixmap", None), "pdfocr_tobytes") and hasattr(fitz, "get_tessdata")
+
+
+# Define una función para localizar los modelos de Tesseract que usará el OCR integrado de PyMuPDF.
+def locate_tessdata(tessdata_dir: Optional[str] = None) -> str:
+    """
+    Resuelve el directorio de modelos como fitz.get_tessdata, pero consultando 'tesseract --list-langs'
+    con SUBPROCESS_KWARGS: fitz lo lanza mediante una shell que, en Windows, abre una consola.
+    :param tessdata_dir: Directorio elegido por el usuario; None busca el del sistema.
+    :return: Ruta del directorio de modelos.
+    """
+    # Con un directorio explícito o TESSDATA_PREFIX, fitz lo devuelve sin lanzar procesos.
+    if tessdata_dir or os.environ.get("TESSDATA_PREFIX"):
+        return fitz.get_tessdata(tessdata_dir)
+    # Pregunta a Tesseract dónde están sus modelos, sin ventana de consola.
+    if which("tesseract") is not None:
+        try:
+            listing = subprocess.run(["tesseract", "--list-langs"], capture_output=True, text=True,
+                                     timeout=30, **SUBPROCESS_KWARGS).stdout
+        except (OSError, subprocess.SubprocessError):
+            # Si Tesseract no responde, se continúa con las demás heurísticas.
+            listing = ""
+        # Extrae la ruta de la cabecera 'List of available languages in "<ruta>" (N):'.
+        match = re.search(r'List of available languages in "(.+)"', listing)
+        if match:
+            return match.group(1)
+    # Si no lo indica, se recurre al resto de heurísticas de PyMuPDF.
+    return fitz.get_tessdata()
+
+
+# Define una función para aplicar OCR a una página con el Tesseract integrado en PyMuPDF.
+def ocr_page_in_process(doc: "fitz.Document", page_number_1based: int, dpi: int, grayscale: bool,
+                        lang: str, tessdata_dir: Optional[str]) -> bytes:
+    """
+    Renderiza una página y genera en memoria su PDF con capa de texto sin lanzar procesos
+    externos (Pixmap.pdfocr_tobytes). Evita el arranque de 'tesseract' por página y el paso de la
+    imagen por una tubería, pero no admite paralelismo, ya que PyMuPDF no es seguro entre hilos.
+    :param doc: Documento PyMuPDF ya abierto.
+    :param page_number_1based: Número de página base-1.
+    :param dpi: Resolución de renderizado.
+    :param grayscale: Si es True, renderiza en escala de grises.
+    :param lang: Códigos de idioma Tesseract (p. ej., 'spa+eng').
+    :param tessdata_dir: Directorio de modelos ya resuelto (p. ej. con locate_tessdata); si fuera None,
+        PyMuPDF lanzaría 'tesseract --list-langs' en cada llamada para localizarlo.
+    :return: Bytes del PDF de una página generado.
+    """
+    # Renderiza la página al DPI y espacio de color indicados.
+    pix = render_page_pixmap(doc, page_number_1based, dpi, grayscale)
+    # Aplica OCR dentro del proceso y devuelve el PDF buscable resultante.
+    return pix.pdfocr_tobytes(language=lang, tessdata=tessdata_dir)
+
+
+# Define una función para detectar si una página ya contiene texto extraíble.
+def page_has_text_layer(doc: "fitz.Document", page_number_1based: int,
+                        min_chars: int = TEXT_LAYER_MIN_CHARS) -> bool:
+    """
+    Indica si una página ya es digital (tiene capa de texto) y, por tanto, no necesita OCR.
+    La extracción de texto de PyMuPDF es muy barata comparada con renderizar y ejecutar Tesseract.
+    :param doc: Documento PyMuPDF ya abierto.
+    :param page_number_1based: Número de página base-1 a comprobar.
+    :param min_chars: Caracteres mínimos (sin espacios extremos) para considerarla digital.
+    :return: True si la página supera el umbral de texto extraíble.
+    """
+    # Valida que la página solicitada está dentro de rango (un índice negativo contaría desde el final).
+    ensure(1 <= page_number_1based <= len(doc), f"Página fuera de rango: {page_number_1based}")
+    # Extrae el texto plano de la página y compara su longitud con el umbral.
+    return len(doc[page_number_1based - 1].get_text("text").strip()) >= min_chars
+
+
+# Define una función para copiar una página del PDF original a un PDF independiente.
+def copy_page_to_pdf(doc: "fitz.Document", page_number_1based: int) -> bytes:
+    """
+    Copia una página tal cual (sin rasterizar) a un PDF de una sola página en memoria.
+    Se usa para las páginas digitales, que se conservan intactas en el resultado final.
+    :param doc: Documento PyMuPDF ya abierto.
+    :param page_number_1based: Número de página base-1 a copiar.
+    :return: Bytes del PDF de una página generado.
+    """
+    # Valida que la página existe (con -1, insert_pdf copiaría el documento completo).
+    ensure(1 <= page_number_1based <= len(doc), f"Página fuera de rango: {page_number_1based}")
+    # Crea un documento vacío y le inserta la página original.
+    with fitz.open() as single:
+        single.insert_pdf(doc, from_page=page_number_1based - 1, to_page=page_number_1based - 1)
+        # Devuelve el PDF de una página serializado en memoria.
+        return single.tobytes()
+
+
+# Define una función para localizar el directorio de modelos 'fast' o 'best' de Tesseract.
+def find_tessdata_dir(variant: str, lang: str, rotate: bool = False) -> Optional[str]:
+    """
+    Busca un directorio 'tessdata_<variant>' que contenga todos los idiomas solicitados
+    (y el modelo 'osd' de detección de orientación si se van a rotar páginas).
+    Se consulta primero la variable TESSDATA_<VARIANT>_PREFIX, después carpetas hermanas o
+    hijas de TESSDATA_PREFIX y, por último, las rutas de instalación habituales.
+    :param variant: 'fast' o 'best'.
+    :param lang: Códigos de idioma Tesseract (p. ej., 'spa+eng').
+    :param rotate: Si es True, exige también 'osd.traineddata' (lo necesita --rotate-pages de OCRmyPDF).
+    :return: Ruta al directorio encontrado o None si no está instalado.
+    """
+    # Nombre del directorio que publica el proyecto Tesseract para cada variante.
+    dirname = f"tessdata_{variant}"
+    # Modelos que deben estar presentes en el directorio.
+    required = lang.split("+") + (["osd"] if rotate else [])
+    # Prepara la lista de candidatos en orden de preferencia.
+    candidates: List[str] = []
+    # Añade la ruta explícita indicada por el usuario, si existe.
+    explicit = os.environ.get(f"TESSDATA_{variant.upper()}_PREFIX")
+    if explicit:
+        candidates.append(explicit)
+    # Añade las ubicaciones relativas a TESSDATA_PREFIX, si está definida.
+    prefix = os.environ.get("TESSDATA_PREFIX")
+    if prefix:
+        candidates.append(os.path.join(os.path.dirname(os.path.normpath(prefix)), dirname))
+        candidates.append(os.path.join(prefix, dirname))
+    # Añade las rutas de instalación habituales.
+    candidates += [os.path.join(base, dirname) for base in TESSDATA_SEARCH_DIRS]
+    # Devuelve el primer candidato que contenga los modelos de todos los idiomas.
+    for candidate in candidates:
+        if all(os.path.isfile(os.path.join(candidate, f"{code}.traineddata")) for code in required):
+            return candidate
+    # No se encontró la variante solicitada.
+    return None
+
+
+# Define una función para preparar el entorno de los procesos que ejecutan Tesseract.
+def tesseract_env(tessdata_dir: Optional[str] = None, limit_threads: bool = True) -> Dict[str, str]:
+    """
+    Devuelve una copia del entorno con OMP_THREAD_LIMIT=1 (salvo que el usuario lo haya fijado).
+    Cuando las páginas se procesan en paralelo, si cada Tesseract abre además sus propios hilos
+    OpenMP, los núcleos se sobresuscriben y el rendimiento cae drásticamente.
+    :param tessdata_dir: Directorio de modelos a usar (TESSDATA_PREFIX); None conserva el actual.
+    :param limit_threads: Si es False (un único proceso), Tesseract puede usar varios hilos OpenMP.
+    :return: Diccionario de entorno para pasar a subprocess.
+    """
+    # Copia el entorno actual para no modificar el del proceso de la GUI.
+    env = dict(os.environ)
+    # Limita OpenMP a un hilo por proceso de Tesseract cuando hay varios en paralelo.
+    if limit_threads:
+        env.setdefault("OMP_THREAD_LIMIT", "1")
+    # Apunta Tesseract al directorio de modelos elegido, si se indicó.
+    if tessdata_dir:
+        env["TESSDATA_PREFIX"] = tessdata_dir
+    # Devuelve el entorno preparado.
+    return env
+
+
+# Define una corrutina para aplicar Tesseract a una imagen y producir un PDF buscable.
+async def tesseract_ocr_image_to_pdf(image: bytes, lang: str, dpi: int,
+                                     tessdata_dir: Optional[str] = None,
+                                     limit_threads: bool = True) -> bytes:
+    """
+    Ejecuta Tesseract como subproceso asíncrono leyendo la imagen por stdin y recoge por stdout
+    el PDF con capa de texto, sin pasar por ficheros intermedios. Al no bloquear el hilo mientras
+    espera, permite tener varias páginas en Tesseract a la vez.
+    :param image: Bytes de la imagen de la página (PNM).
     :param lang: Códigos de idioma Tesseract (p. ej., 'spa', 'spa+eng').
-    :return: Ruta absoluta al PDF generado por Tesseract.
+    :param dpi: Resolución con la que se renderizó la imagen; PNM no la guarda y, sin ella,
+        Tesseract asumiría 70 dpi y generaría páginas varias veces más grandes que el original.
+    :param tessdata_dir: Directorio de modelos ('fast'/'best') a usar; None usa el del sistema.
+    :param limit_threads: Limita Tesseract a un hilo OpenMP (recomendado con varias páginas a la vez).
+    :return: Bytes del PDF generado por Tesseract.
     """
     # Asegura que el binario 'tesseract' está disponible.
     ensure(which("tesseract") is not None, "Tesseract no está instalado o no está en PATH.")
-    # Construye la ruta base de salida (sin extensión) para Tesseract.
-    base = os.path.join(out_dir, os.path.splitext(os.path.basename(image_path))[0])
-    # Prepara el comando Tesseract con salida en PDF.
-    cmd = ["tesseract", image_path, base, "-l", lang, "pdf"]
-    # Ejecuta el proceso y captura salida para diagnóstico.
-    subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    # Determina la ruta final esperada del PDF generado.
-    pdf_path = base + ".pdf"
-    # Verifica que el PDF se haya producido correctamente.
-    ensure(os.path.exists(pdf_path), f"No se generó el PDF de Tesseract para {image_path}")
-    # Devuelve la ruta del PDF.
-    return pdf_path
+    # Prepara el comando Tesseract leyendo la imagen de stdin y escribiendo en stdout, con el motor LSTM
+    # y la resolución real del renderizado.
+    cmd = ["tesseract", "stdin", "stdout", "--oem", "1", "-l", lang, "--dpi", str(dpi)]
+    # Indica el directorio de modelos elegido, si lo hay.
+    if tessdata_dir:
+        cmd += ["--tessdata-dir", tessdata_dir]
+    # Solicita la salida en PDF con capa de texto.
+    cmd += ["pdf"]
+    # Lanza el proceso sin bloquear el bucle de eventos (ni abrir consola en Windows) y captura
+    # la salida para diagnóstico.
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE, env=tesseract_env(limit_threads=limit_threads), **SUBPROCESS_KWARGS
+    )
+    try:
+        # Envía la imagen por stdin y espera a que Tesseract termine drenando stdout y stderr.
+        out, err = await proc.communicate(image)
+    except asyncio.CancelledError:
+        # Si la tarea se cancela, termina el proceso para no dejarlo huérfano.
+        proc.kill()
+        await proc.wait()
+        raise
+    # Lanza la excepción estándar si Tesseract falló.
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, output=out, stderr=err)
+    # Verifica que Tesseract haya producido un PDF.
+    ensure(out.startswith(b"%PDF"), "Tesseract no devolvió un PDF válido por stdout.")
+    # Devuelve los bytes del PDF.
+    return out
 
 
 # Define una función para unir múltiples PDFs en un único archivo final.
-def merge_pdfs(pdf_paths: List[str], output_pdf: str) -> None:
+def merge_pdfs(pdf_paths: Sequence[Union[str, bytes]], output_pdf: str, template: Optional[str] = None) -> None:
     """
-    Une una lista de PDFs (típicamente páginas OCR) en un único PDF final.
-    :param pdf_paths: Rutas de PDFs a concatenar en orden.
+    Une una lista de PDFs (típicamente páginas OCR) en un único PDF final usando PyMuPDF.
+    Cada parte se copia al documento de salida y se cierra de inmediato, de modo que solo
+    hay un origen abierto a la vez.
+    :param pdf_paths: Rutas o contenidos en memoria de los PDFs a concatenar en orden.
     :param output_pdf: Ruta del PDF final generado.
+    :param template: PDF original del que copiar metadatos e índice (opcional).
     """
-    # Crea el objeto PdfMerger para gestionar la concatenación.
-    merger = PdfMerger()
-    # Añade cada PDF al merger en el orden recibido.
-    for p in pdf_paths:
-        merger.append(p)
-    # Abre el archivo de salida en modo binario de escritura.
-    with open(output_pdf, "wb") as f:
-        # Escribe el PDF combinado a disco.
-        merger.write(f)
-    # Cierra recursos del merger de forma explícita.
-    merger.close()
+    # Crea un documento vacío que recibirá todas las páginas.
+    with fitz.open() as out:
+        # Añade cada PDF en el orden recibido.
+        for p in pdf_paths:
+            # Abre la parte desde disco o desde memoria según su tipo.
+            with (fitz.open("pdf", p) if isinstance(p, bytes) else fitz.open(p)) as src:
+                out.insert_pdf(src)
+        # Si se indica el original, recupera sus metadatos y su índice, que insert_pdf no copia.
+        if template:
+            with fitz.open(template) as tpl:
+                out.set_metadata(tpl.metadata)
+                # Un índice mal formado en el original no debe impedir generar la salida.
+                try:
+                    out.set_toc(tpl.get_toc())
+                except ValueError:
+                    pass
+        # Guarda el PDF combinado compactando objetos duplicados y comprimiendo streams.
+        out.save(output_pdf, garbage=3, deflate=True)
 
 
 # Define una función para ejecutar OCR con OCRmyPDF si está disponible.
 def run_ocrmypdf_cli(input_pdf: str, output_pdf: str, lang: str, rotate: bool, deskew: bool,
-                     clean: bool, jobs: int, pages: List[int],
+                     clean: bool, jobs: int, pages: Sequence[Union[int, Tuple[int, int]]],
                      log_callback: Optional[Callable[[str], None]] = None,
-                     progress_callback: Optional[Callable[[int], None]] = None) -> None:
+                     progress_callback: Optional[Callable[[int], None]] = None,
+                     skip_text: bool = False,
+                     pdfa: bool = True,
+                     tessdata_dir: Optional[str] = None,
+                     limit_threads: Optional[bool] = None,
+                     process_callback: Optional[Callable[["subprocess.Popen[bytes]"], None]] = None) -> None:
     """
     Ejecuta el proceso OCR mediante la utilidad de línea de comandos 'ocrmypdf'.
     :param input_pdf: Ruta al PDF de entrada (escaneado).
@@ -290,24 +832,31 @@ def run_ocrmypdf_cli(input_pdf: str, output_pdf: str, lang: str, rotate: bool, d
     :param deskew: Si es True, intenta enderezar páginas.
     :param clean: Si es True, aplica limpieza de fondo/ruido.
     :param jobs: Número de hilos para paralelizar.
-    :param pages: Lista de páginas base-1 a procesar (vacío = todas).
+    :param pages: Páginas base-1 o intervalos (inicio, fin) a procesar (vacío = todas).
     :param log_callback: Callback opcional para emitir mensajes de advertencia.
+    :param progress_callback: Callback opcional para emitir el porcentaje de avance.
+    :param skip_text: Si es True, OCRmyPDF omite las páginas que ya tienen texto.
+    :param pdfa: Si es True, genera PDF/A; si es False, un PDF normal, evitando la conversión
+                 final con Ghostscript (monohilo y muy lenta en documentos grandes).
+    :param tessdata_dir: Directorio de modelos de Tesseract ('fast'/'best'); None usa el del sistema.
+    :param limit_threads: Fuerza (o no) OMP_THREAD_LIMIT=1; None lo aplica solo si jobs > 1.
+    :param process_callback: Recibe el proceso lanzado (solo con callbacks de log o progreso),
+        p. ej. para poder terminarlo desde otro hilo.
     """
     # Asegura que 'ocrmypdf' está disponible en PATH.
     ensure(which("ocrmypdf") is not None, "ocrmypdf no está instalado o no está en PATH.")
     # Asegura que 'tesseract' está disponible, ya que OCRmyPDF lo utiliza.
     ensure(which("tesseract") is not None, "Tesseract no está instalado o no está en PATH.")
     # Verifica Ghostscript según el sistema operativo.
-    if platform.system() == "Windows":
-        ensure(which("gswin64c") or which("gswin32c"),
-               "Ghostscript no está instalado o no está en PATH (gswin64c/gswin32c).")
-    else:
-        ensure(which("gs") is not None, "Ghostscript no está instalado o no está en PATH (gs).")
+    ensure(find_ghostscript() is not None,
+           f"Ghostscript no está instalado o no está en PATH ({'/'.join(GS_CANDIDATES)}).")
     # Verifica 'qpdf', requerido por OCRmyPDF para saneamiento de PDFs.
     ensure(which("qpdf") is not None, "qpdf no está instalado o no está en PATH.")
 
-    # Construye la línea de comandos con parámetros.
-    cmd = ["ocrmypdf", "--language", lang, "--output-type", "pdfa"]
+    # Construye la línea de comandos con parámetros y el tipo de salida (PDF/A o PDF normal).
+    cmd = ["ocrmypdf", "--language", lang, "--output-type", "pdfa" if pdfa else "pdf"]
+    # Fuerza el motor LSTM de Tesseract, evitando el motor heredado.
+    cmd += ["--tesseract-oem", "1"]
     # Añade rotación si procede.
     if rotate:
         cmd += ["--rotate-pages", "--rotate-pages-threshold", "15.0"]
@@ -316,10 +865,8 @@ def run_ocrmypdf_cli(input_pdf: str, output_pdf: str, lang: str, rotate: bool, d
         cmd += ["--deskew"]
     # Verifica si se solicitó limpieza y está disponible la herramienta externa 'unpaper'.
     if clean:
-        # Comprueba si 'unpaper' está accesible en PATH.
-        unpaper_path = which("unpaper")
-        # Si la herramienta no existe, emite advertencia y desactiva limpieza.
-        if unpaper_path is None:
+        # Si 'unpaper' no está accesible en PATH, emite advertencia y desactiva limpieza.
+        if not _has("unpaper"):
             # Construye el mensaje de advertencia para informar al usuario.
             warning = ("La opción de limpieza requiere el binario 'unpaper'. "
                        "Se omitirá la limpieza para evitar errores. Instala 'unpaper' "
@@ -334,42 +881,67 @@ def run_ocrmypdf_cli(input_pdf: str, output_pdf: str, lang: str, rotate: bool, d
     # Añade limpieza/optimización cuando está activada y disponible.
     if clean:
         cmd += ["--clean", "--remove-background"]
+    # Omite el OCR de páginas digitales (con capa de texto) si se solicita.
+    if skip_text:
+        cmd += ["--skip-text"]
     # Añade paralelización si se indica.
     if jobs and jobs > 1:
         cmd += ["--jobs", str(jobs)]
+        # Limita cada Tesseract a un hilo para no sobresuscribir la CPU, si OCRmyPDF lo admite.
+        if _ocrmypdf_has_option("--tesseract-thread-limit"):
+            cmd += ["--tesseract-thread-limit", "1"]
     # Si se especifican páginas, conviértelas a formato compacto 'a-b,c'.
     if pages:
         cmd += ["--pages", pages_to_ranges(pages)]
     # Añade rutas de entrada y salida al final.
     cmd += [input_pdf, output_pdf]
+    # Prepara el entorno para que los Tesseract que lanza OCRmyPDF no sobresuscriban la CPU.
+    # Con un solo job, Tesseract puede aprovechar sus hilos OpenMP sin competir con otros.
+    env = tesseract_env(tessdata_dir, limit_threads=jobs > 1 if limit_threads is None else limit_threads)
     # Determina si se deben capturar logs o progreso.
     capture_streams = log_callback is not None or progress_callback is not None
     # Si se capturan streams, procesa la salida línea a línea para informar progreso.
     if capture_streams:
-        # Lanza OCRmyPDF con stdout y stderr combinados para analizarlos.
+        # Lanza OCRmyPDF en modo binario y sin búfer, con stdout y stderr combinados para analizarlos.
         process = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            universal_newlines=True
+            bufsize=0,
+            env=env,
+            **SUBPROCESS_KWARGS
         )
-        # Garantiza que stdout esté disponible antes de iterar.
+        # Garantiza que stdout esté disponible antes de leer.
         assert process.stdout is not None
-        # Recorre cada línea emitida por la herramienta externa.
-        for raw_line in process.stdout:
-            # Elimina saltos de línea finales para mantener formato limpio.
+        # Entrega el proceso a quien lo haya pedido.
+        if process_callback:
+            process_callback(process)
+        # Último porcentaje emitido y momento de su envío, para limitar la frecuencia de actualización.
+        last_percent = -1
+        last_emit = 0.0
+        # Último porcentaje retenido por la limitación de frecuencia, pendiente de enviar.
+        deferred_percent: Optional[int] = None
+
+        # Función que reenvía una línea de salida al log y extrae el progreso si lo contiene.
+        def handle_line(raw_line: str) -> None:
+            nonlocal last_percent, last_emit, deferred_percent
+            # Elimina espacios y saltos de línea finales (incluido '\r') para mantener formato limpio.
             line = raw_line.rstrip()
             # Si existe callback de log, reenvía el mensaje a la interfaz.
             if log_callback:
                 log_callback(line)
             else:
                 print(line)
-            # Si hay callback de progreso, intenta extraer el porcentaje.
-            if progress_callback:
+            # Sin callback de progreso no hay nada más que hacer con la línea.
+            if not progress_callback:
+                return
+            # Parte del porcentaje retenido, para enviarlo en cuanto haya pasado el intervalo.
+            percent = deferred_percent
+            # Intenta extraer el porcentaje; la comprobación previa de subcadena (las mismas grafías
+            # que admite _PROGRESS_RE) evita pasar por la expresión regular en el resto de líneas.
+            if "page" in line or "Page" in line:
                 # Busca patrones "page X of Y" producidos por OCRmyPDF.
-                match = re.search(r"page\s+(\d+)\s+of\s+(\d+)", line, re.IGNORECASE)
+                match = _PROGRESS_RE.search(line)
                 # Cuando se detecta el patrón, calcula el progreso aproximado.
                 if match:
                     # Convierte la página actual a entero seguro.
@@ -378,19 +950,59 @@ def run_ocrmypdf_cli(input_pdf: str, output_pdf: str, lang: str, rotate: bool, d
                     total_pages = max(1, int(match.group(2)))
                     # Calcula el porcentaje de avance respecto al total.
                     percent = int(current_page * 100 / total_pages)
-                    # Emite el porcentaje a la interfaz.
-                    progress_callback(percent)
+            # Descarta el valor si no hay progreso nuevo que comunicar.
+            if percent is None or percent == last_percent:
+                deferred_percent = None
+                return
+            # Emite el porcentaje como mucho cada PROGRESS_MIN_INTERVAL (el 100% siempre);
+            # si llega antes, lo retiene para no perder el último valor conocido.
+            now = time.monotonic()
+            if percent == 100 or now - last_emit >= PROGRESS_MIN_INTERVAL:
+                progress_callback(percent)
+                last_percent = percent
+                last_emit = now
+                deferred_percent = None
+            else:
+                deferred_percent = percent
+
+        # Decodifica por bloques grandes en lugar de línea a línea; el decodificador incremental
+        # conserva los caracteres UTF-8 que queden partidos entre dos lecturas.
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        # Guarda la última línea incompleta hasta que llegue su salto de línea.
+        pending = ""
+        while True:
+            # Lee lo que haya disponible en la tubería (b'' indica fin de la salida).
+            chunk = process.stdout.read(PIPE_READ_SIZE)
+            # Añade el texto decodificado y lo separa con las reglas de splitlines(), que igual que
+            # el modo universal_newlines corta también en '\r' (el que usa la salida de progreso).
+            pending += decoder.decode(chunk, final=not chunk)
+            lines = pending.splitlines(keepends=True)
+            pending = ""
+            # Mientras quede salida, guarda la última línea si está incompleta o acaba en '\r'
+            # (su '\n' puede llegar en la siguiente lectura y no debe generar una línea vacía).
+            if chunk and lines and (lines[-1].endswith("\r") or lines[-1] == lines[-1].splitlines()[0]):
+                pending = lines.pop()
+            # Procesa cada línea completa (al agotarse la salida, también la última sin salto).
+            for raw_line in lines:
+                handle_line(raw_line)
+            # Termina cuando la tubería indica fin de la salida.
+            if not chunk:
+                break
+        # Envía el último porcentaje retenido para que la barra refleje el avance real, incluso si falla.
+        if progress_callback and deferred_percent is not None:
+            progress_callback(deferred_percent)
+            last_percent = deferred_percent
         # Espera el fin del proceso para capturar el código de retorno.
         retcode = process.wait()
         # Lanza excepción estándar si hubo error.
         if retcode != 0:
             raise subprocess.CalledProcessError(retcode, cmd)
-        # Asegura que el progreso se marca al 100% al terminar.
-        if progress_callback:
+        # Asegura que el progreso se marca al 100% al terminar (salvo que ya se haya enviado).
+        if progress_callback and last_percent != 100:
             progress_callback(100)
     else:
         # Si no se necesitan logs ni progreso, ejecuta el comando directamente.
-        subprocess.run(cmd, check=True)
+        subprocess.run(cmd, check=True, env=env, **SUBPROCESS_KWARGS)
 
 
 # Define una clase QThread para ejecutar el OCR en segundo plano y no bloquear la GUI.
@@ -419,7 +1031,10 @@ class OCRWorker(QThread):
                  jobs: int,
                  dpi: int,
                  pages_expr: str,
-                 force_tesseract: bool):
+                 force_tesseract: bool,
+                 keep_color: bool = False,
+                 pdfa: bool = False,
+                 ocr_quality: str = "default"):
         # Inicializa la superclase QThread.
         super().__init__()
         # Almacena rutas y parámetros de OCR.
@@ -433,6 +1048,9 @@ class OCRWorker(QThread):
         self.dpi = dpi
         self.pages_expr = pages_expr
         self.force_tesseract = force_tesseract
+        self.keep_color = keep_color
+        self.pdfa = pdfa
+        self.ocr_quality = ocr_quality
 
     # Método principal del hilo: decide estrategia y ejecuta OCR.
     def run(self) -> None:
@@ -449,31 +1067,66 @@ class OCRWorker(QThread):
             # Emite log con total de páginas.
             self.log_signal.emit(f"Total de páginas detectadas: {total_pages}")
 
-            # Parsea expresión de páginas a lista (vacío será interpretado como 'todas').
+            # Parsea expresión de páginas a intervalos (vacío será interpretado como 'todas').
             pages = parse_pages(self.pages_expr, total_pages=total_pages) if self.pages_expr else []
-            # Si la lista está vacía, genera todas.
+            # Si no hay intervalos, cubre el documento completo con uno solo.
             if not pages:
-                pages = list(range(1, total_pages + 1))
+                pages = [(1, total_pages)]
+            # Ajusta la selección al documento e informa si se descartaron páginas inexistentes.
+            fitted = fit_pages_to_document(pages, total_pages)
+            if fitted != pages:
+                self.log_signal.emit(f"Se ignoran las páginas posteriores a la {total_pages}; "
+                                     f"se procesarán: {pages_to_ranges(fitted)}")
+            pages = fitted
 
             # Calcula si usaremos OCRmyPDF, sujeto a disponibilidad y preferencia del usuario.
             use_ocrmypdf = (not self.force_tesseract) and (which("ocrmypdf") is not None)
+
+            # Localiza los modelos de Tesseract de la calidad elegida (None = los del sistema).
+            tessdata_dir = None
+            if self.ocr_quality != "default":
+                # La rotación automática solo la aplica OCRmyPDF y requiere el modelo 'osd'.
+                needs_osd = use_ocrmypdf and self.rotate
+                tessdata_dir = find_tessdata_dir(self.ocr_quality, self.lang, rotate=needs_osd)
+                # Informa del directorio usado o de que se recurre a los modelos del sistema.
+                if tessdata_dir:
+                    self.log_signal.emit(f"Modelos de Tesseract '{self.ocr_quality}': {tessdata_dir}")
+                else:
+                    required = f"{self.lang}+osd" if needs_osd else self.lang
+                    self.log_signal.emit(f"No se encontraron modelos 'tessdata_{self.ocr_quality}' para "
+                                         f"'{required}'; se usarán los del sistema.")
             # Rama de ejecución según motor.
             if use_ocrmypdf:
                 # Emite log informando del motor seleccionado.
-                self.log_signal.emit("Usando OCRmyPDF (limpieza, rotación y PDF/A).")
-                # Ejecuta OCRmyPDF como proceso externo.
-                run_ocrmypdf_cli(
-                    input_pdf=self.input_pdf,
-                    output_pdf=self.output_pdf,
-                    lang=self.lang,
-                    rotate=self.rotate,
-                    deskew=self.deskew,
-                    clean=self.clean,
-                    jobs=self.jobs,
-                    pages=pages,
-                    log_callback=self.log_signal.emit,
-                    progress_callback=self.progress_signal.emit
-                )
+                self.log_signal.emit("Usando OCRmyPDF (limpieza, rotación y PDF/A)." if self.pdfa
+                                     else "Usando OCRmyPDF (limpieza y rotación, salida PDF).")
+                # Busca páginas que ya tienen capa de texto para que OCRmyPDF las omita.
+                with fitz.open(self.input_pdf) as doc:
+                    digital_pages = [pn for pn in iter_pages(pages) if page_has_text_layer(doc, pn)]
+                # Informa de las páginas digitales que no se volverán a procesar.
+                if digital_pages:
+                    self.log_signal.emit(f"Páginas con texto que se omitirán: {pages_to_ranges(digital_pages)}")
+                # En documentos grandes (sin PDF/A) reparte el trabajo entre varios OCRmyPDF en paralelo.
+                chunks = [] if self.pdfa else plan_ocrmypdf_chunks(pages, total_pages, self.jobs)
+                if chunks:
+                    self._run_ocrmypdf_chunked(chunks, pages, digital_pages, tessdata_dir)
+                else:
+                    # Ejecuta OCRmyPDF como proceso externo.
+                    run_ocrmypdf_cli(
+                        input_pdf=self.input_pdf,
+                        output_pdf=self.output_pdf,
+                        lang=self.lang,
+                        rotate=self.rotate,
+                        deskew=self.deskew,
+                        clean=self.clean,
+                        jobs=self.jobs,
+                        pages=pages,
+                        log_callback=self.log_signal.emit,
+                        progress_callback=self.progress_signal.emit,
+                        skip_text=bool(digital_pages),
+                        pdfa=self.pdfa,
+                        tessdata_dir=tessdata_dir
+                    )
                 # Emite señal de finalización.
                 self.done_signal.emit(self.output_pdf)
                 # Finaliza el método.
@@ -481,39 +1134,294 @@ class OCRWorker(QThread):
 
             # Si no se usa OCRmyPDF, recurre al modo Tesseract por página.
             self.log_signal.emit("Usando fallback: Tesseract por página (PyMuPDF + Tesseract).")
-            # Crea un directorio temporal para imágenes y PDFs intermedios.
-            with tempfile.TemporaryDirectory(prefix="ocr_pages_") as tmpdir:
-                # Lista para almacenar rutas a PDFs generados por Tesseract.
-                part_pdfs: List[str] = []
-                # Recorre páginas solicitadas con índice para progreso.
-                for idx, pn in enumerate(pages, start=1):
-                    # Renderiza la página a imagen PNG con el DPI indicado.
-                    img = render_page_to_image(self.input_pdf, pn, self.dpi, tmpdir)
-                    # Emite log por página renderizada.
-                    self.log_signal.emit(f"Página {pn} renderizada → {os.path.basename(img)}")
-                    # Aplica Tesseract a la imagen para generar PDF con texto.
-                    pdf_part = tesseract_ocr_image_to_pdf(img, tmpdir, self.lang)
-                    # Emite log por página OCR completada.
-                    self.log_signal.emit(f"Página {pn} OCR completada → {os.path.basename(pdf_part)}")
-                    # Añade la ruta del PDF parcial a la lista.
-                    part_pdfs.append(pdf_part)
-                    # Calcula y emite el progreso aproximado.
-                    progress = int(idx * 100 / max(1, len(pages)))
-                    self.progress_signal.emit(progress)
-
-                # Una vez procesadas todas las páginas, une los PDFs parciales.
-                merge_pdfs(part_pdfs, self.output_pdf)
-                # Emite log final indicando la ruta del PDF de salida.
-                self.log_signal.emit(f"PDF final generado: {self.output_pdf}")
-                # Asegura que el progreso queda al 100%.
-                self.progress_signal.emit(100)
-                # Emite señal de finalización con éxito.
-                self.done_signal.emit(self.output_pdf)
+            # Abre el documento una única vez para renderizar todas las páginas.
+            with fitz.open(self.input_pdf) as doc:
+                # Aplica OCR a todas las páginas con varios Tesseract concurrentes (PDFs en memoria).
+                part_by_page = asyncio.run(self._ocr_pages_async(doc, pages, tessdata_dir))
+
+            # Ordena los PDFs parciales por número de página para unirlos en orden.
+            part_pdfs = [part_by_page[pn] for pn in sorted(part_by_page)]
+
+            # Una vez procesadas todas las páginas, une los PDFs parciales.
+            merge_pdfs(part_pdfs, self.output_pdf)
+            # Emite log final indicando la ruta del PDF de salida.
+            self.log_signal.emit(f"PDF final generado: {self.output_pdf}")
+            # Asegura que el progreso queda al 100%.
+            self.progress_signal.emit(100)
+            # Emite señal de finalización con éxito.
+            self.done_signal.emit(self.output_pdf)
 
         except Exception as e:
             # En caso de error, emite el mensaje para mostrar al usuario.
             self.error_signal.emit(str(e))
 
+    # Método que reparte un documento grande en bloques procesados por varios OCRmyPDF en paralelo.
+    def _run_ocrmypdf_chunked(self,
+                              chunks: List[Tuple[int, int]],
+                              pages: List[Tuple[int, int]],
+                              digital_pages: List[int],
+                              tessdata_dir: Optional[str]) -> None:
+        """
+        Extrae cada bloque a un PDF temporal, lanza un OCRmyPDF por bloque y une los resultados.
+        Así la fase de optimización final de OCRmyPDF, que es secuencial, también se paraleliza.
+        :param chunks: Bloques contiguos (inicio, fin) base-1 que cubren el documento, todos
+            con páginas seleccionadas (ver plan_ocrmypdf_chunks).
+        :param pages: Intervalos de páginas seleccionadas para OCR.
+        :param digital_pages: Páginas que ya tienen capa de texto.
+        :param tessdata_dir: Directorio de modelos de Tesseract (None = los del sistema).
+        """
+        # Informa del reparto elegido.
+        self.log_signal.emit(f"Documento dividido en {len(chunks)} bloques para OCRmyPDF en paralelo.")
+        # Reparte los hilos de OCRmyPDF entre los bloques para no sobresuscribir la CPU.
+        jobs_per_chunk = max(1, self.jobs // len(chunks))
+        # Pondera el progreso de cada bloque por su número de páginas seleccionadas.
+        weights = [count_pages(clip_intervals(pages, s, e)) for s, e in chunks]
+        total_weight = sum(weights)
+        # Guarda el último progreso de cada bloque y el último porcentaje emitido.
+        progress = [0] * len(chunks)
+        last_pct = [-1]
+        # Protege el progreso compartido entre los hilos de los bloques.
+        lock = threading.Lock()
+
+        # Función que combina el progreso de un bloque con el del resto.
+        def report(i: int, value: int) -> None:
+            with lock:
+                progress[i] = value
+                pct = sum(p * w for p, w in zip(progress, weights)) // total_weight
+                # Emite solo cuando el porcentaje global cambia.
+                if pct != last_pct[0]:
+                    last_pct[0] = pct
+                    self.progress_signal.emit(pct)
+
+        # Procesos de OCRmyPDF en marcha y aviso de fallo, para detener el resto si un bloque falla.
+        processes: List["subprocess.Popen[bytes]"] = []
+        failed = threading.Event()
+
+        # Función que registra el proceso de un bloque (y lo detiene si otro bloque ya falló).
+        def track(process: "subprocess.Popen[bytes]") -> None:
+            with lock:
+                processes.append(process)
+                if failed.is_set():
+                    process.terminate()
+
+        # Los bloques de entrada más las salidas de OCRmyPDF ocupan varias veces el PDF original:
+        # solo se usa el tmpfs (RAM) si tiene holgura para ello.
+        min_free = max(SHM_MIN_FREE_BYTES, 3 * os.path.getsize(self.input_pdf))
+        # Crea un directorio temporal (en RAM si es posible) para los bloques de entrada y salida.
+        with tempfile.TemporaryDirectory(prefix="ocr_chunks_", dir=fast_temp_dir(min_free)) as tmpdir:
+            # Prepara las rutas de entrada y salida de cada bloque.
+            inputs = [os.path.join(tmpdir, f"chunk_{i:03d}_in.pdf") for i in range(len(chunks))]
+            outputs = [os.path.join(tmpdir, f"chunk_{i:03d}_out.pdf") for i in range(len(chunks))]
+            # Extrae cada bloque a su propio PDF abriendo el original una única vez.
+            with fitz.open(self.input_pdf) as doc:
+                for (s, e), path in zip(chunks, inputs):
+                    with fitz.open() as part:
+                        part.insert_pdf(doc, from_page=s - 1, to_page=e - 1)
+                        part.save(path)
+
+            # Función que procesa un bloque con su propio OCRmyPDF.
+            def run_chunk(i: int) -> None:
+                s, e = chunks[i]
+                # Ejecuta OCRmyPDF sobre el bloque, prefijando el log con su rango.
+                run_ocrmypdf_cli(
+                    input_pdf=inputs[i],
+                    output_pdf=outputs[i],
+                    lang=self.lang,
+                    rotate=self.rotate,
+                    deskew=self.deskew,
+                    clean=self.clean,
+                    jobs=jobs_per_chunk,
+                    # Traduce la selección de páginas a la numeración del bloque.
+                    pages=clip_intervals(pages, s, e),
+                    log_callback=lambda msg: self.log_signal.emit(f"[{s}-{e}] {msg}"),
+                    progress_callback=lambda value: report(i, value),
+                    skip_text=any(s <= pn <= e for pn in digital_pages),
+                    pdfa=False,
+                    tessdata_dir=tessdata_dir,
+                    # Los bloques corren en paralelo aunque cada uno tenga un solo job.
+                    limit_threads=True,
+                    process_callback=track
+                )
+
+            # Lanza un hilo por bloque; cada uno espera a su proceso de OCRmyPDF.
+            with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+                futures = [executor.submit(run_chunk, i) for i in range(len(chunks))]
+                try:
+                    # Propaga el primer error en cuanto se produce, sea cual sea el bloque.
+                    for future in as_completed(futures):
+                        future.result()
+                except Exception:
+                    # Detiene los OCRmyPDF del resto de bloques para no esperar a que terminen.
+                    with lock:
+                        failed.set()
+                        for process in processes:
+                            if process.poll() is None:
+                                process.terminate()
+                    raise
+
+            # Une los bloques en orden conservando metadatos e índice del original.
+            merge_pdfs(outputs, self.output_pdf, template=self.input_pdf)
+        # Informa de la ruta final.
+        self.log_signal.emit(f"PDF final generado: {self.output_pdf}")
+
+    # Corrutina que canaliza renderizado y OCR en dos etapas conectadas por una cola acotada.
+    async def _ocr_pages_async(self, doc: "fitz.Document", pages: List[Tuple[int, int]],
+                               tessdata_dir: Optional[str] = None) -> Dict[int, bytes]:
+        """
+        Renderiza las páginas en un hilo productor y las reparte entre 'jobs' consumidores que
+        ejecutan Tesseract, de modo que el renderizado de la página siguiente se solapa con el OCR
+        de las anteriores. La cola admite como mucho 2*jobs imágenes para acotar la memoria.
+        Las páginas que ya tienen capa de texto se copian sin pasar por Tesseract. Los PDFs
+        parciales se mantienen en memoria, sin ficheros intermedios.
+        :param doc: Documento PyMuPDF abierto, compartido por todas las páginas.
+        :param pages: Intervalos (inicio, fin) de páginas base-1 a procesar.
+        :param tessdata_dir: Directorio de modelos de Tesseract; None usa el del sistema.
+        :return: Diccionario que asocia cada página con los bytes de su PDF parcial.
+        """
+        # Diccionario que asocia cada página con su PDF parcial (OCR de Tesseract o copia directa).
+        part_by_page: Dict[int, bytes] = {}
+        # Número total de páginas a procesar, para calcular el progreso.
+        total = count_pages(pages)
+        # Número de consumidores (procesos Tesseract simultáneos).
+        workers = max(1, self.jobs)
+        # Cola acotada entre el renderizado y el OCR; None marca el fin del flujo.
+        queue: "asyncio.Queue[Optional[Tuple[int, bytes]]]" = asyncio.Queue(maxsize=2 * workers)
+        # Obtiene el bucle de eventos en curso para delegar el renderizado.
+        loop = asyncio.get_running_loop()
+        # Con un solo hilo no hay paralelismo que perder: se usa el OCR integrado de PyMuPDF si existe.
+        in_process = workers == 1 and supports_in_process_ocr()
+        # Directorio de modelos para el OCR integrado, resuelto una sola vez: sin él, PyMuPDF
+        # lanzaría una shell con 'tesseract --list-langs' por cada página.
+        inproc_tessdata: Optional[str] = None
+        if in_process:
+            try:
+                inproc_tessdata = locate_tessdata(tessdata_dir)
+            except Exception as e:
+                # Sin modelos localizables, el OCR integrado no funcionaría: se usa 'tesseract' externo.
+                in_process = False
+                self.log_signal.emit(f"OCR integrado de PyMuPDF no disponible ({e}); se usará 'tesseract'.")
+
+        # Estado para agrupar notificaciones: último porcentaje emitido y logs pendientes.
+        last_progress = -1
+        log_buffer: List[str] = []
+        last_flush = time.monotonic()
+
+        # Envía de una vez los mensajes de log acumulados.
+        def flush_logs() -> None:
+            """Emite los logs pendientes como un único bloque de texto."""
+            nonlocal last_flush
+            # Solo emite si hay mensajes acumulados.
+            if log_buffer:
+                self.log_signal.emit("\n".join(log_buffer))
+                log_buffer.clear()
+            # Anota el momento del último envío.
+            last_flush = time.monotonic()
+
+        # Registra el PDF parcial de una página y emite log y progreso de forma agrupada.
+        def record(pn: int, pdf_part: bytes, message: str) -> None:
+            """
+            Guarda el PDF parcial de la página y notifica el avance a la interfaz sin saturar
+            el bucle de eventos de Qt: el progreso solo se emite cuando cambia el porcentaje y
+            los logs se agrupan cada LOG_FLUSH_INTERVAL segundos.
+            """
+            nonlocal last_progress
+            # Registra el PDF parcial de la página.
+            part_by_page[pn] = pdf_part
+            # Acumula el mensaje y lo envía si ha pasado el intervalo de agrupación.
+            log_buffer.append(message)
+            if time.monotonic() - last_flush >= LOG_FLUSH_INTERVAL:
+                flush_logs()
+            # Calcula el progreso y lo emite solo si cambia el porcentaje entero.
+            progress = int(len(part_by_page) * 100 / max(1, total))
+            if progress != last_progress:
+                self.progress_signal.emit(progress)
+                last_progress = progress
+
+        # Productor: renderiza las páginas en orden y las deja en la cola.
+        async def produce(render_executor: ThreadPoolExecutor) -> None:
+            """Copia las páginas digitales y renderiza y encola el resto; al final envía un centinela por consumidor."""
+            nonlocal in_process
+            for pn in iter_pages(pages):
+                # Si la página ya tiene texto, la copia tal cual en lugar de rasterizarla y aplicar OCR.
+                if await loop.run_in_executor(render_executor, page_has_text_layer, doc, pn):
+                    pdf_part = await loop.run_in_executor(render_executor, copy_page_to_pdf, doc, pn)
+                    record(pn, pdf_part, f"Página {pn} ya tenía texto; se conserva sin OCR")
+                    continue
+                # Si procede, aplica OCR dentro del proceso sin pasar por la cola ni lanzar 'tesseract'.
+                if in_process:
+                    try:
+                        pdf_part = await loop.run_in_executor(render_executor, ocr_page_in_process, doc, pn,
+                                                              self.dpi, not self.keep_color, self.lang,
+                                                              inproc_tessdata)
+                    except Exception as e:
+                        # Si PyMuPDF no puede usar Tesseract (p. ej., sin tessdata), recurre al proceso externo.
+                        in_process = False
+                        log_buffer.append(f"OCR integrado de PyMuPDF no disponible ({e}); se usará 'tesseract'.")
+                    else:
+                        record(pn, pdf_part, f"Página {pn} OCR completada")
+                        continue
+                # Renderiza la página en memoria sin bloquear a los Tesseract en curso.
+                img = await loop.run_in_executor(render_executor, render_page_to_image,
+                                                 doc, pn, self.dpi, not self.keep_color)
+                # Encola la imagen; espera si ya hay 2*jobs imágenes pendientes.
+                await queue.put((pn, img))
+            # Indica a cada consumidor que no quedan más páginas.
+            for _ in range(workers):
+                await queue.put(None)
+
+        # Consumidor: aplica Tesseract a las páginas que va sacando de la cola.
+        async def consume() -> None:
+            """Procesa páginas de la cola hasta recibir el centinela, emitiendo log y progreso."""
+            while True:
+                # Espera la siguiente página renderizada.
+                item = await queue.get()
+                # El centinela None indica el fin del flujo.
+                if item is None:
+                    return
+                pn, img = item
+                # Aplica Tesseract a la imagen para generar el PDF con capa de texto.
+                pdf_part = await tesseract_ocr_image_to_pdf(img, self.lang, self.dpi, tessdata_dir,
+                                                          limit_threads=self.jobs > 1)
+                # Registra la página y actualiza log y progreso.
+                record(pn, pdf_part, f"Página {pn} OCR completada")
+
+        # Usa un único hilo de renderizado porque PyMuPDF no es seguro entre hilos.
+        with ThreadPoolExecutor(max_workers=1) as render_executor:
+            # Arranca el productor y los consumidores.
+            tasks = [asyncio.create_task(produce(render_executor))]
+            tasks += [asyncio.create_task(consume()) for _ in range(workers)]
+            try:
+                # Espera a que se completen ambas etapas.
+                await asyncio.gather(*tasks)
+            except BaseException:
+                # Ante un fallo, cancela el resto de etapas y espera a que se detengan.
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+            finally:
+                # Envía los logs que quedaran pendientes.
+                flush_logs()
+        # Devuelve el mapa página → PDF parcial.
+        return part_by_page
+
+
+# Define una clase QThread para comprobar los motores disponibles sin bloquear la GUI.
+class EngineProbeWorker(QThread):
+    """
+    Hilo breve que recorre PATH buscando los motores de OCR y emite el resultado.
+    """
+    # Señal con el diccionario de disponibilidad de motores.
+    state_signal = pyqtSignal(dict)
+
+    # Método principal del hilo: comprueba los motores y emite el estado.
+    def run(self) -> None:
+        """
+        Ejecuta 'probe_engines' fuera del hilo de la interfaz y emite su resultado.
+        """
+        # Emite el estado calculado para que la ventana lo almacene y lo muestre.
+        self.state_signal.emit(probe_engines())
+
 
 # Define una clase principal de ventana que contiene todos los controles de la UI.
 class OCRWindow(QMainWindow):
@@ -610,6 +1518,8 @@ class OCRWindow(QMainWindow):
         self.help_btn.setToolTip("Ayuda / Manual de usuario")
         # Conecta el clic del botón a la función que muestra el manual.
         self.help_btn.clicked.connect(self.show_manual)
+        # Cuadro del manual, creado al pedirlo por primera vez.
+        self._manual_box: Optional[QMessageBox] = None
         # Añade el botón de ayuda a la fila de idiomas.
         lang_row.addWidget(self.help_btn)
         # Añade la fila y la nota al layout principal.
@@ -635,11 +1545,16 @@ class OCRWindow(QMainWindow):
         self.force_tesseract_chk = QCheckBox("Forzar Tesseract por página (sin OCRmyPDF)")
         # Por defecto, no forzar (dejar que use OCRmyPDF si existe).
         self.force_tesseract_chk.setChecked(False)
+        # Crea checkbox para generar PDF/A con OCRmyPDF.
+        self.pdfa_chk = QCheckBox("Salida PDF/A (más lento)")
+        # Por defecto, PDF normal: evita la conversión final con Ghostscript, que usa un solo núcleo.
+        self.pdfa_chk.setChecked(False)
         # Añade todos los checkboxes al layout horizontal.
         opt_row.addWidget(self.clean_chk)
         opt_row.addWidget(self.rotate_chk)
         opt_row.addWidget(self.deskew_chk)
         opt_row.addWidget(self.force_tesseract_chk)
+        opt_row.addWidget(self.pdfa_chk)
         # Añade la fila al layout principal.
         layout.addLayout(opt_row)
 
@@ -656,6 +1571,10 @@ class OCRWindow(QMainWindow):
         self.dpi_spin.setMaximum(600)
         # Establece el valor por defecto (300).
         self.dpi_spin.setValue(300)
+        # Crea checkbox para conservar el color de las páginas en el modo fallback.
+        self.keep_color_chk = QCheckBox("Conservar color (fallback)")
+        # Por defecto, renderiza en grises: es más rápido y no afecta al reconocimiento.
+        self.keep_color_chk.setChecked(False)
         # Crea etiqueta para número de hilos.
         jobs_label = QLabel("Hilos (jobs):")
         # Crea un QSpinBox para número de hilos.
@@ -667,12 +1586,28 @@ class OCRWindow(QMainWindow):
         # Establece valor por defecto en función de CPU disponible.
         default_jobs = max(1, (os.cpu_count() or 2) // 2)
         self.jobs_spin.setValue(default_jobs)
+        # Explica el efecto del número de hilos sobre Tesseract.
+        self.jobs_spin.setToolTip("Páginas procesadas en paralelo. Con más de 1, cada Tesseract se limita "
+                                  "a un hilo (OMP_THREAD_LIMIT=1) para no sobrecargar la CPU.")
+        # Crea etiqueta para el selector de calidad/velocidad del OCR.
+        quality_label = QLabel("Calidad OCR:")
+        # Crea un QComboBox con los modelos de Tesseract disponibles ('fast', 'best' o del sistema).
+        self.quality_combo = QComboBox()
+        for text, code in OCR_QUALITY_OPTIONS:
+            self.quality_combo.addItem(text, userData=code)
+        # Establece un texto de ayuda sobre la elección.
+        self.quality_combo.setToolTip("'Rápida' usa tessdata_fast (≈2x más rápido); si no está instalada, "
+                                      "se usan los modelos del sistema.")
         # Añade widgets al layout de parámetros numéricos.
         num_row.addWidget(dpi_label)
         num_row.addWidget(self.dpi_spin)
+        num_row.addWidget(self.keep_color_chk)
         num_row.addSpacing(20)
         num_row.addWidget(jobs_label)
         num_row.addWidget(self.jobs_spin)
+        num_row.addSpacing(20)
+        num_row.addWidget(quality_label)
+        num_row.addWidget(self.quality_combo)
         # Añade la fila al layout principal.
         layout.addLayout(num_row)
 
@@ -712,22 +1647,48 @@ class OCRWindow(QMainWindow):
         self.log_edit.setReadOnly(True)
         # Define una altura mínima razonable para el área de log.
         self.log_edit.setMinimumHeight(180)
+        # Acumula las líneas de log recibidas para volcarlas juntas y no maquetar el documento por línea.
+        self._log_buffer: List[str] = []
+        # Crea un temporizador que vuelca el log acumulado de forma periódica durante el OCR.
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(LOG_UI_FLUSH_MS)
+        self._log_timer.timeout.connect(self._flush_log)
         # Añade el área de logs al layout principal.
         layout.addWidget(self.log_edit)
 
         # ---------------- Estado de motores disponibles ----------------
+        # Crea una fila para el estado de motores y su botón de actualización.
+        status_row = QHBoxLayout()
         # Crea una etiqueta para mostrar qué motores están disponibles.
         self.status_label = QLabel("Estado motores: ...")
-        # Añade la etiqueta al layout principal.
-        layout.addWidget(self.status_label)
+        # Crea un botón para volver a comprobar los motores bajo demanda.
+        self.refresh_btn = QToolButton()
+        # Asigna un icono estándar de recarga.
+        self.refresh_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_BrowserReload))
+        # Establece un texto accesible para lectores de pantalla.
+        self.refresh_btn.setToolTip("Volver a comprobar los motores instalados")
+        # Conecta el clic a la comprobación en segundo plano.
+        self.refresh_btn.clicked.connect(lambda: self._probe_engines(force=True))
+        # Añade la etiqueta y el botón a la fila, y la fila al layout principal.
+        status_row.addWidget(self.status_label)
+        status_row.addWidget(self.refresh_btn)
+        status_row.addStretch(1)
+        layout.addLayout(status_row)
+        # Estado de motores de la última comprobación (vacío hasta que termine la primera).
+        self._engine_state: Dict[str, bool] = {}
+        # Hilo de comprobación de motores en curso, si lo hay.
+        self._probe_worker: Optional[EngineProbeWorker] = None
+        # Huella de PATH tomada en la última comprobación de motores.
+        self._path_fingerprint: Optional[Tuple[Tuple[str, Optional[int]], ...]] = None
 
         # ---------------- Finaliza configuración de la ventana ----------------
         # Establece el widget central de la ventana.
         self.setCentralWidget(central)
         # Ajusta un tamaño inicial amigable.
         self.resize(900, 640)
-        # Actualiza el estado de motores disponibles.
-        self.refresh_engine_status()
+        # Programa la comprobación de motores para justo después de mostrar la ventana,
+        # de modo que las búsquedas en PATH no retrasen el primer pintado.
+        QTimer.singleShot(0, self._probe_engines)
 
     # Define una función para alternar el check de un idioma cuando el usuario lo selecciona en el combo.
     def toggle_lang_check(self, index: int) -> None:
@@ -745,23 +1706,54 @@ class OCRWindow(QMainWindow):
     # Define una función para actualizar la etiqueta de estado de motores disponibles.
     def refresh_engine_status(self) -> None:
         """
-        Refresca la información de disponibilidad de motores y dependencias del sistema.
-        Muestra si están presentes 'ocrmypdf', 'tesseract', 'ghostscript' y 'qpdf'.
-        """
-        # Detecta disponibilidad de binarios clave.
-        have_ocrmypdf = which("ocrmypdf") is not None
-        have_tesseract = which("tesseract") is not None
-        have_qpdf = which("qpdf") is not None
-        # Ghostscript varía en Windows vs Unix.
-        have_gs = which("gswin64c") or which("gswin32c") if platform.system() == "Windows" else which("gs")
-        # Construye un texto de estado claro.
-        text = (f"ocrmypdf: {'✔' if have_ocrmypdf else '✖'}   "
-                f"tesseract: {'✔' if have_tesseract else '✖'}   "
-                f"ghostscript: {'✔' if have_gs else '✖'}   "
-                f"qpdf: {'✔' if have_qpdf else '✖'}")
+        Muestra la disponibilidad de motores guardada en la última comprobación.
+        No recorre PATH: para volver a comprobar los motores usa '_probe_engines'.
+        """
+        # Si la primera comprobación aún no ha terminado, mantiene el texto provisional.
+        if not self._engine_state:
+            self.status_label.setText("Estado motores: ...")
+            return
+        # Rellena la plantilla con la marca correspondiente a cada motor.
+        text = _STATUS_TPL.format_map({name: _OK_MARK if ok else _MISSING_MARK
+                                       for name, ok in self._engine_state.items()})
         # Actualiza la etiqueta en la UI.
         self.status_label.setText(text)
 
+    # Define una función para volver a comprobar los motores en un hilo aparte.
+    def _probe_engines(self, force: bool = True) -> None:
+        """
+        Vacía la caché de rutas y lanza la comprobación de motores en segundo plano.
+        El resultado llega a '_on_engines_probed' mediante una señal.
+        :param force: Si es False, solo comprueba de nuevo cuando algún directorio de PATH ha cambiado.
+        """
+        # Evita lanzar una segunda comprobación mientras la anterior sigue en curso.
+        if self._probe_worker is not None and self._probe_worker.isRunning():
+            return
+        # Sin cambios en PATH desde la última comprobación, el estado guardado sigue siendo válido.
+        fingerprint = path_fingerprint()
+        if not force and fingerprint == self._path_fingerprint:
+            return
+        self._path_fingerprint = fingerprint
+        # Vacía las cachés de rutas y capacidades para detectar herramientas instaladas durante la sesión.
+        which.cache_clear()
+        _CAPS.clear()
+        # Crea el hilo de comprobación y conecta su resultado.
+        self._probe_worker = EngineProbeWorker()
+        self._probe_worker.state_signal.connect(self._on_engines_probed)
+        # Inicia la comprobación sin bloquear la interfaz.
+        self._probe_worker.start()
+
+    # Define una función que recibe el resultado de la comprobación de motores.
+    def _on_engines_probed(self, state: Dict[str, bool]) -> None:
+        """
+        Guarda el estado de motores recibido y actualiza la etiqueta.
+        :param state: Diccionario nombre -> disponible.
+        """
+        # Almacena el estado para futuras actualizaciones de la etiqueta.
+        self._engine_state = state
+        # Refresca la etiqueta con el nuevo estado.
+        self.refresh_engine_status()
+
     # Define una función para abrir un diálogo de selección de archivo de entrada.
     def browse_input(self) -> None:
         """
@@ -777,8 +1769,7 @@ class OCRWindow(QMainWindow):
         self.in_edit.setText(path)
         # Si no hay salida definida, sugiere una con sufijo "_OCR".
         if not self.out_edit.text().strip():
-            base, ext = os.path.splitext(path)
-            self.out_edit.setText(base + "_OCR.pdf")
+            self.out_edit.setText(suggest_output_path(path))
 
     # Define una función para abrir un diálogo "Guardar como..." para la salida.
     def browse_output(self) -> None:
@@ -827,8 +1818,7 @@ class OCRWindow(QMainWindow):
             self.in_edit.setText(selected_path)
             # Si no había una salida definida, sugiere el nombre con sufijo _OCR.
             if not self.out_edit.text().strip():
-                base, _ = os.path.splitext(selected_path)
-                self.out_edit.setText(base + "_OCR.pdf")
+                self.out_edit.setText(suggest_output_path(selected_path))
             # Marca el evento como aceptado.
             event.acceptProposedAction()
         else:
@@ -840,35 +1830,14 @@ class OCRWindow(QMainWindow):
         """
         Muestra un manual de usuario con explicación detallada de cada opción y recomendaciones.
         """
-        # Redacta el texto del manual con formato simple.
-        manual = (
-            "Manual de usuario – OCR PDF GUI\n\n"
-            "1) PDF de entrada: Selecciona el archivo PDF escaneado que deseas convertir.\n"
-            "2) PDF de salida: Ubicación y nombre del PDF con OCR que se generará.\n"
-            "3) Idioma(s) OCR: Despliegue y marca uno o varios idiomas (puedes abrir y marcar "
-            "varias veces). Códigos: Español(spa), Inglés(eng), Alemán(deu), Francés(fra). "
-            "Selecciona los que se correspondan con el idioma del documento para mejorar la precisión.\n"
-            "4) Limpiar fondo/ruido: Con OCRmyPDF elimina ruido y fondos grises; mejora legibilidad.\n"
-            "5) Rotar páginas automáticamente: Detecta y corrige orientación incorrecta.\n"
-            "6) Enderezar (deskew): Corrige inclinaciones leves derivadas del escaneo.\n"
-            "7) Forzar Tesseract por página: Si marcas esto, ignorará OCRmyPDF y usará el modo fallback "
-            "(renderizado de páginas + Tesseract). Útil si no tienes OCRmyPDF instalado.\n"
-            "8) DPI (fallback): Resolución de renderizado para el modo Tesseract por página. 300–400 "
-            "suele equilibrar calidad y tamaño.\n"
-            "9) Hilos (jobs): Paraleliza el proceso (OCRmyPDF y fallback). No abuses si tu equipo va justo.\n"
-            "10) Nº de páginas / rangos: Puedes limitar a un subset. Formatos válidos: '1-100,150,200-'. "
-            "Vacío = todas las páginas. Los rangos abiertos (como '200-') usan el total detectado.\n\n"
-            "Motores y dependencias:\n"
-            "- OCRmyPDF (recomendado): requiere 'tesseract', 'ghostscript' y 'qpdf'.\n"
-            "- Fallback Tesseract por página: requiere 'tesseract' y PyMuPDF.\n\n"
-            "Buenas prácticas:\n"
-            "- Si el documento es muy antiguo o con latinismos, combina idiomas, p. ej. 'spa+lat' "
-            "(debes tener el idioma instalado en Tesseract). En la app, los idiomas predefinidos son spa/eng/deu/fra.\n"
-            "- Empieza con un rango pequeño para validar calidad antes de procesar todo.\n"
-            "- Conserva siempre el PDF original sin OCR como respaldo.\n"
-        )
-        # Muestra el texto en un cuadro informativo modal.
-        QMessageBox.information(self, "Ayuda / Manual", manual)
+        # Crea el cuadro del manual la primera vez y lo reutiliza en las siguientes.
+        if self._manual_box is None:
+            self._manual_box = QMessageBox(self)
+            self._manual_box.setIcon(QMessageBox.Icon.Information)
+            self._manual_box.setWindowTitle("Ayuda / Manual")
+            self._manual_box.setText(_MANUAL_TEXT)
+        # Muestra el manual de forma modal.
+        self._manual_box.exec()
 
     # Define una función para recoger opciones de UI y lanzar el OCR en un hilo.
     def start_ocr(self) -> None:
@@ -882,8 +1851,8 @@ class OCRWindow(QMainWindow):
         if not in_path:
             QMessageBox.warning(self, "Falta archivo", "Selecciona un PDF de entrada.")
             return
-        # Valida que el archivo existe físicamente.
-        if not os.path.exists(in_path):
+        # Valida que el archivo existe físicamente (una única consulta al sistema de archivos).
+        if not Path(in_path).is_file():
             QMessageBox.critical(self, "Archivo no encontrado", "La ruta del PDF de entrada no existe.")
             return
 
@@ -891,16 +1860,16 @@ class OCRWindow(QMainWindow):
         out_path = self.out_edit.text().strip()
         # Si no hay salida, sugiere una en el mismo directorio con sufijo _OCR.
         if not out_path:
-            base, ext = os.path.splitext(in_path)
-            out_path = base + "_OCR.pdf"
+            out_path = suggest_output_path(in_path)
             self.out_edit.setText(out_path)
 
+        # Guarda el combo, su número de elementos y los enums de Qt en locales para no repetir accesos.
+        lc = self.lang_combo
+        n = lc.count()
+        role = Qt.ItemDataRole.CheckStateRole
+        checked = Qt.CheckState.Checked
         # Construye el string de idiomas según items marcados (combina con '+').
-        langs: List[str] = []
-        for i in range(self.lang_combo.count()):
-            state = self.lang_combo.itemData(i, Qt.ItemDataRole.CheckStateRole)
-            if state == Qt.CheckState.Checked:
-                langs.append(self.lang_combo.itemData(i))
+        langs: List[str] = [lc.itemData(i) for i in range(n) if lc.itemData(i, role) == checked]
         # Si no hay ninguno marcado, por seguridad establece 'spa'.
         if not langs:
             langs = ["spa"]
@@ -912,6 +1881,10 @@ class OCRWindow(QMainWindow):
         rotate = self.rotate_chk.isChecked()
         deskew = self.deskew_chk.isChecked()
         force_tesseract = self.force_tesseract_chk.isChecked()
+        keep_color = self.keep_color_chk.isChecked()
+        pdfa = self.pdfa_chk.isChecked()
+        # Lee la calidad de OCR elegida ('fast', 'best' o 'default').
+        ocr_quality = self.quality_combo.currentData()
 
         # Lee parámetros numéricos de la UI.
         dpi = int(self.dpi_spin.value())
@@ -920,7 +1893,8 @@ class OCRWindow(QMainWindow):
         # Obtiene la expresión de páginas tal como la introdujo el usuario.
         pages_expr = self.pages_edit.text().strip()
 
-        # Limpia el área de logs y resetea la barra de progreso.
+        # Limpia el área de logs (y lo pendiente de volcar) y resetea la barra de progreso.
+        self._log_buffer.clear()
         self.log_edit.clear()
         self.progress.setValue(0)
 
@@ -935,7 +1909,10 @@ class OCRWindow(QMainWindow):
             jobs=jobs,
             dpi=dpi,
             pages_expr=pages_expr,
-            force_tesseract=force_tesseract
+            force_tesseract=force_tesseract,
+            keep_color=keep_color,
+            pdfa=pdfa,
+            ocr_quality=ocr_quality
         )
 
         # Conecta las señales del worker a las funciones de actualización de UI.
@@ -946,17 +1923,32 @@ class OCRWindow(QMainWindow):
 
         # Deshabilita el botón mientras se procesa para evitar duplicados.
         self.run_btn.setEnabled(False)
+        # Arranca el volcado periódico del log.
+        self._log_timer.start()
         # Inicia el hilo de trabajo.
         self.worker.start()
 
     # Define una función para añadir mensajes al área de logs con salto de línea.
     def append_log(self, text: str) -> None:
         """
-        Añade una línea al log visible para el usuario.
+        Añade una línea al log visible para el usuario. La línea se acumula y se muestra en el
+        siguiente volcado de '_flush_log'.
         :param text: Mensaje de información o avance.
         """
-        # Inserta el texto seguido de un salto de línea.
-        self.log_edit.append(text)
+        # Acumula el texto para el próximo volcado.
+        self._log_buffer.append(text)
+
+    # Define una función para volcar de una vez las líneas de log acumuladas.
+    def _flush_log(self) -> None:
+        """
+        Inserta en el área de log todas las líneas pendientes con una única llamada a Qt.
+        """
+        # Si no hay líneas pendientes, no toca el documento.
+        if not self._log_buffer:
+            return
+        # Inserta todas las líneas juntas y vacía el búfer.
+        self.log_edit.append("\n".join(self._log_buffer))
+        self._log_buffer.clear()
 
     # Define una función para gestionar la finalización correcta del OCR.
     def ocr_done(self, out_path: str) -> None:
@@ -966,8 +1958,11 @@ class OCRWindow(QMainWindow):
         """
         # Rehabilita el botón de ejecución.
         self.run_btn.setEnabled(True)
-        # Actualiza el estado de motores (por si se instalaron durante la sesión).
-        self.refresh_engine_status()
+        # Detiene el volcado periódico y muestra las últimas líneas del log.
+        self._log_timer.stop()
+        self._flush_log()
+        # Vuelve a comprobar los motores en segundo plano solo si PATH ha cambiado durante la sesión.
+        self._probe_engines(force=False)
         # Muestra un cuadro informativo de éxito con la ruta de salida.
         QMessageBox.information(self, "OCR completado", f"Se generó el PDF con OCR:\n{out_path}")
 
@@ -981,6 +1976,9 @@ class OCRWindow(QMainWindow):
         self.run_btn.setEnabled(True)
         # Añade el error al área de logs para diagnóstico.
         self.append_log(f"[ERROR] {message}")
+        # Detiene el volcado periódico y muestra las últimas líneas del log, incluido el error.
+        self._log_timer.stop()
+        self._flush_log()
         # Muestra un cuadro de diálogo crítico con el mensaje de error.
         QMessageBox.critical(self, "Error en OCR", message)
 
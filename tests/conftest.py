@@ -0,0 +1,318 @@
+# =========================================================================
+# Configuración compartida de pytest: stubs de dependencias opcionales y dobles de subprocess
+# =========================================================================
+
+# Importa io para simular la salida binaria de procesos fingidos.
+import io
+
+# Importa pathlib para localizar la raíz del proyecto.
+from pathlib import Path
+
+# Importa sys para registrar módulos simulados y ajustar el path de importaciones.
+import sys
+
+# Importa types para crear módulos simulados cuando falten dependencias externas.
+import types
+
+# Importa typing para describir los argumentos y colecciones de los dobles de prueba.
+from typing import Any, Callable, Dict, List, Optional
+
+# Importa pytest para declarar fixtures compartidas.
+import pytest
+
+# Importa subprocess para construir los resultados simulados de subprocess.run.
+import subprocess
+
+# Crea un stub mínimo para la dependencia opcional 'fitz' si no está instalada.
+if 'fitz' not in sys.modules:
+    # Genera un módulo simulado con atributos neutros suficientes para las importaciones.
+    sys.modules['fitz'] = types.SimpleNamespace(Matrix=lambda *_args, **_kwargs: None, open=None)
+
+# Crea stubs básicos para los módulos de PyQt6 en entornos de testing sin la librería instalada.
+if 'PyQt6' not in sys.modules:
+    # Construye módulo raíz vacío para PyQt6.
+    pyqt6_root = types.ModuleType('PyQt6')
+    # Construye submódulo QtCore con clases y funciones mínimas.
+    qtcore_module = types.ModuleType('PyQt6.QtCore')
+    # Construye submódulo QtWidgets con clases mínimas.
+    qtwidgets_module = types.ModuleType('PyQt6.QtWidgets')
+
+    # Define una clase de hilo ficticia compatible con herencia.
+    class _DummyThread:
+        # Constructor neutro sin argumentos obligatorios.
+        def __init__(self, *_args, **_kwargs) -> None:
+            return None
+
+    # Define una señal ficticia con métodos connect/emit sin efecto.
+    class _DummySignal:
+        # Constructor neutro.
+        def __init__(self, *_args, **_kwargs) -> None:
+            return None
+
+        # Método connect que ignora los argumentos.
+        def connect(self, *_args, **_kwargs) -> None:
+            return None
+
+        # Método emit que ignora los argumentos.
+        def emit(self, *_args, **_kwargs) -> None:
+            return None
+
+    # Define un temporizador ficticio que ignora las programaciones diferidas.
+    class _DummyTimer:
+        # Constructor neutro.
+        def __init__(self, *_args, **_kwargs) -> None:
+            return None
+
+        # Método estático singleShot que no ejecuta la función programada.
+        @staticmethod
+        def singleShot(*_args, **_kwargs) -> None:
+            return None
+
+    # Define la función pyqtSignal que retorna la señal ficticia.
+    def _dummy_pyqt_signal(*_args, **_kwargs) -> _DummySignal:
+        return _DummySignal()
+
+    # Prepara el namespace Qt con atributos utilizados en el código.
+    qt_namespace = types.SimpleNamespace(
+        ItemDataRole=types.SimpleNamespace(CheckStateRole=0),
+        CheckState=types.SimpleNamespace(Checked=1)
+    )
+
+    # Asigna los símbolos necesarios al submódulo QtCore.
+    qtcore_module.Qt = qt_namespace
+    qtcore_module.QThread = _DummyThread
+    qtcore_module.QTimer = _DummyTimer
+    qtcore_module.pyqtSignal = _dummy_pyqt_signal
+
+    # Define una clase base vacía para los widgets.
+    class _DummyWidget:
+        # Constructor neutro.
+        def __init__(self, *_args, **_kwargs) -> None:
+            return None
+
+        # Define método setSizePolicy sin efecto.
+        def setSizePolicy(self, *_args, **_kwargs) -> None:
+            return None
+
+        # Define método clicked con atributo connect compatible.
+        @property
+        def clicked(self):
+            # Retorna un objeto con método connect sin efecto.
+            return types.SimpleNamespace(connect=lambda *_args, **_kwargs: None)
+
+        # Define método setText sin efecto.
+        def setText(self, *_args, **_kwargs) -> None:
+            return None
+
+        # Define método setChecked sin efecto.
+        def setChecked(self, *_args, **_kwargs) -> None:
+            return None
+
+        # Define método isChecked que retorna False por defecto.
+        def isChecked(self) -> bool:
+            return False
+
+        # Define método text que retorna cadena vacía.
+        def text(self) -> str:
+            return ""
+
+        # Define método append para QTextEdit simulado.
+        def append(self, *_args, **_kwargs) -> None:
+            return None
+
+    # Mapea cada clase usada en el código a la clase ficticia.
+    widget_names = [
+        'QApplication', 'QMainWindow', 'QWidget', 'QFileDialog', 'QMessageBox', 'QVBoxLayout',
+        'QHBoxLayout', 'QLabel', 'QLineEdit', 'QPushButton', 'QCheckBox', 'QSpinBox',
+        'QTextEdit', 'QProgressBar', 'QComboBox', 'QSizePolicy', 'QStyle', 'QToolButton'
+    ]
+
+    # Asigna la clase ficticia para cada identificador requerido.
+    for name in widget_names:
+        setattr(qtwidgets_module, name, _DummyWidget)
+
+    # Inserta los submódulos y el módulo raíz en sys.modules.
+    sys.modules['PyQt6'] = pyqt6_root
+    sys.modules['PyQt6.QtCore'] = qtcore_module
+    sys.modules['PyQt6.QtWidgets'] = qtwidgets_module
+
+# Añade la carpeta raíz del proyecto al sys.path para resolver importaciones relativas.
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+
+# Define una fixture que vacía la caché de capacidades entre pruebas.
+@pytest.fixture(autouse=True)
+def _limpiar_capacidades():
+    """Evita que las capacidades memorizadas en una prueba afecten a las siguientes."""
+    # Importa el módulo aquí para que los stubs anteriores ya estén registrados.
+    import ocr_gui
+    # Vacía la caché antes y después de cada prueba.
+    ocr_gui._CAPS.clear()
+    yield
+    ocr_gui._CAPS.clear()
+
+
+# Define un doble de subprocess que simula OCRmyPDF sin lanzar procesos reales.
+class FakeSubprocess:
+    """
+    Sustituye subprocess.Popen y subprocess.run, registrando cada lanzamiento y
+    sirviendo una salida configurable.
+    """
+
+    # Constructor con una ejecución correcta, sin salida y sin opciones en la ayuda.
+    def __init__(self) -> None:
+        # Bytes que emitirá cada proceso por stdout (stderr va combinado).
+        self.output = b""
+        # Tamaño máximo de cada lectura (None = toda la salida de una vez).
+        self.chunk_size: Optional[int] = None
+        # Código de retorno de cada proceso.
+        self.returncode = 0
+        # Texto devuelto por 'ocrmypdf --help'.
+        self.help_text = ""
+        # Lanzamientos de Popen registrados: comando, entorno y resto de argumentos.
+        self.calls: List[Dict[str, Any]] = []
+        # Comandos recibidos por subprocess.run.
+        self.run_calls: List[List[str]] = []
+
+    # Devuelve los comandos lanzados con Popen, en orden.
+    @property
+    def cmds(self) -> List[List[str]]:
+        return [call["cmd"] for call in self.calls]
+
+    # Devuelve los entornos entregados a Popen, en orden.
+    @property
+    def envs(self) -> List[Dict[str, str]]:
+        return [call["env"] for call in self.calls]
+
+    # Sustituto de subprocess.Popen: registra el lanzamiento y devuelve un proceso simulado.
+    def popen(self, cmd: List[str], **kwargs: Any) -> "_FakeProcess":
+        # Guarda copias para que los cambios posteriores del llamador no afecten a las pruebas.
+        self.calls.append({"cmd": list(cmd), "env": dict(kwargs.pop("env", None) or {}), "kwargs": kwargs})
+        return _FakeProcess(self.output, self.chunk_size, self.returncode)
+
+    # Sustituto de subprocess.run: registra el comando y devuelve la ayuda configurada.
+    def run(self, cmd: List[str], **_kwargs: Any) -> subprocess.CompletedProcess:
+        self.run_calls.append(list(cmd))
+        return subprocess.CompletedProcess(cmd, 0, stdout=self.help_text, stderr="")
+
+
+# Define el proceso simulado que devuelve FakeSubprocess.popen.
+class _FakeProcess:
+    """Expone un stdout que entrega la salida por bloques y un wait con el código configurado."""
+
+    # Constructor que prepara el stream de salida.
+    def __init__(self, output: bytes, chunk_size: Optional[int], returncode: int) -> None:
+        self.stdout = self
+        self._stream = io.BytesIO(output)
+        self._chunk_size = chunk_size
+        self._returncode = returncode
+
+    # Lee como mucho chunk_size bytes, ignorando el tamaño solicitado si se ha fijado uno.
+    def read(self, size: int = -1) -> bytes:
+        return self._stream.read(self._chunk_size or size)
+
+    # Indica el código de retorno configurado.
+    def wait(self) -> int:
+        return self._returncode
+
+
+# Define una fixture que aísla run_ocrmypdf_cli de procesos, PATH y entorno reales.
+@pytest.fixture
+def fake_popen(monkeypatch: pytest.MonkeyPatch) -> FakeSubprocess:
+    """
+    Sustituye Popen/run por FakeSubprocess y declara disponibles todas las dependencias.
+
+    :param monkeypatch: Fixture de pytest para aplicar los reemplazos.
+    :return: Doble configurable que registra los lanzamientos.
+    """
+    # Importa el módulo aquí para que los stubs anteriores ya estén registrados.
+    import ocr_gui
+    fake = FakeSubprocess()
+    monkeypatch.setattr(ocr_gui.subprocess, "Popen", fake.popen)
+    monkeypatch.setattr(ocr_gui.subprocess, "run", fake.run)
+    # Declara presentes todos los ejecutables; las pruebas pueden sustituirlo de nuevo.
+    monkeypatch.setattr(ocr_gui, "which", lambda name: f"/usr/bin/{name}")
+    # Elimina cualquier OMP_THREAD_LIMIT heredado para comprobar el valor que se fija.
+    monkeypatch.delenv("OMP_THREAD_LIMIT", raising=False)
+    return fake
+
+
+# Define una fixture que lanza run_ocrmypdf_cli con argumentos por defecto.
+@pytest.fixture
+def run_cli(fake_popen: FakeSubprocess, tmp_path: Path) -> Callable[..., None]:
+    """
+    Devuelve una función que ejecuta run_ocrmypdf_cli con valores neutros, sustituibles por nombre.
+
+    :param fake_popen: Doble de subprocess activo durante la prueba.
+    :param tmp_path: Carpeta temporal donde se ubican entrada y salida.
+    :return: Función que acepta solo los argumentos que la prueba quiere fijar.
+    """
+    # Importa el módulo aquí para que los stubs anteriores ya estén registrados.
+    import ocr_gui
+
+    # Ejecuta la función combinando los valores por defecto con los indicados.
+    def run(**overrides: Any) -> None:
+        kwargs: Dict[str, Any] = {
+            "input_pdf": str(tmp_path / "entrada.pdf"),
+            "output_pdf": str(tmp_path / "salida.pdf"),
+            "lang": "spa",
+            "rotate": False,
+            "deskew": False,
+            "clean": False,
+            "jobs": 1,
+            "pages": [],
+            "log_callback": lambda _message: None,
+        }
+        kwargs.update(overrides)
+        ocr_gui.run_ocrmypdf_cli(**kwargs)
+
+    return run
+
+
+# Define una señal que registra lo emitido para inspeccionarlo en las pruebas.
+class SignalRecorder:
+    """Sustituye a una señal de Qt guardando cada valor emitido en 'emitted'."""
+
+    # Constructor que prepara la lista de valores emitidos.
+    def __init__(self) -> None:
+        self.emitted: List[Any] = []
+
+    # Registra el valor emitido (append es atómico, por lo que admite varios hilos).
+    def emit(self, value: Any) -> None:
+        self.emitted.append(value)
+
+
+# Define una fixture que construye OCRWorker con parámetros neutros y señales registradoras.
+@pytest.fixture
+def make_worker(tmp_path: Path) -> Callable[..., Any]:
+    """
+    Devuelve una función que crea un OCRWorker sin Qt, con las señales sustituidas por SignalRecorder.
+
+    :param tmp_path: Carpeta temporal donde se ubican entrada y salida.
+    :return: Función que acepta solo los parámetros que la prueba quiere fijar.
+    """
+    # Importa el módulo aquí para que los stubs anteriores ya estén registrados.
+    import ocr_gui
+
+    # Crea el hilo de trabajo combinando los valores por defecto con los indicados.
+    def make(**overrides: Any) -> "ocr_gui.OCRWorker":
+        kwargs: Dict[str, Any] = {
+            "input_pdf": str(tmp_path / "entrada.pdf"),
+            "output_pdf": str(tmp_path / "salida.pdf"),
+            "lang": "spa",
+            "rotate": False,
+            "deskew": False,
+            "clean": False,
+            "jobs": 2,
+            "dpi": 300,
+            "pages_expr": "",
+            "force_tesseract": False,
+        }
+        kwargs.update(overrides)
+        worker = ocr_gui.OCRWorker(**kwargs)
+        # Sustituye las señales de la clase por registradores propios de esta instancia.
+        for name in ("log_signal", "progress_signal", "done_signal", "error_signal"):
+            setattr(worker, name, SignalRecorder())
+        return worker
+
+    return make
@@ -0,0 +1,48 @@
+# Importa pathlib para crear directorios de modelos ficticios.
+from pathlib import Path
+
+# Importa pytest para aprovechar fixtures como monkeypatch y tmp_path.
+import pytest
+
+# Importa el módulo principal (los stubs de dependencias se registran en conftest.py).
+import ocr_gui
+
+
+# Define una prueba que localiza 'tessdata_fast' junto a TESSDATA_PREFIX.
+def test_find_tessdata_dir_usa_carpeta_hermana(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Comprueba que se elige la carpeta 'tessdata_fast' hermana de TESSDATA_PREFIX si tiene los idiomas."""
+    # Crea la carpeta de modelos rápidos con los idiomas español e inglés.
+    fast_dir = tmp_path / "tessdata_fast"
+    fast_dir.mkdir()
+    (fast_dir / "spa.traineddata").touch()
+    (fast_dir / "eng.traineddata").touch()
+    # Apunta TESSDATA_PREFIX a la carpeta estándar y limpia cualquier ruta explícita heredada.
+    monkeypatch.setenv("TESSDATA_PREFIX", str(tmp_path / "tessdata"))
+    monkeypatch.delenv("TESSDATA_FAST_PREFIX", raising=False)
+    # Evita que las rutas de instalación del sistema influyan en el resultado.
+    monkeypatch.setattr(ocr_gui, "TESSDATA_SEARCH_DIRS", [])
+
+    # Verifica que se encuentra la carpeta cuando están todos los idiomas.
+    assert ocr_gui.find_tessdata_dir("fast", "spa+eng") == str(fast_dir)
+    # Verifica que se descarta si falta alguno de los idiomas pedidos.
+    assert ocr_gui.find_tessdata_dir("fast", "spa+deu") is None
+
+
+# Define una prueba que exige el modelo 'osd' cuando se van a rotar páginas.
+def test_find_tessdata_dir_exige_osd_al_rotar(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Comprueba que una carpeta sin 'osd.traineddata' se descarta solo si se pide rotación."""
+    # Crea la carpeta de modelos rápidos solo con español.
+    fast_dir = tmp_path / "tessdata_fast"
+    fast_dir.mkdir()
+    (fast_dir / "spa.traineddata").touch()
+    # Apunta la variante rápida a esa carpeta y aísla las rutas del sistema.
+    monkeypatch.setenv("TESSDATA_FAST_PREFIX", str(fast_dir))
+    monkeypatch.delenv("TESSDATA_PREFIX", raising=False)
+    monkeypatch.setattr(ocr_gui, "TESSDATA_SEARCH_DIRS", [])
+
+    # Verifica que sin rotación basta con el idioma y con rotación falta 'osd'.
+    assert ocr_gui.find_tessdata_dir("fast", "spa") == str(fast_dir)
+    assert ocr_gui.find_tessdata_dir("fast", "spa", rotate=True) is None
+    # Verifica que, al añadir 'osd', la carpeta vuelve a ser válida para rotar.
+    (fast_dir / "osd.traineddata").touch()
+    assert ocr_gui.find_tessdata_dir("fast", "spa", rotate=True) == str(fast_dir)
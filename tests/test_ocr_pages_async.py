@@ -0,0 +1,217 @@
+# Importa asyncio para ejecutar la canalización y simular Tesseract asíncrono.
+import asyncio
+
+# Importa subprocess para simular el fallo de un Tesseract.
+import subprocess
+
+# Importa typing para describir colecciones utilizadas en las pruebas unitarias.
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+# Importa pytest para aprovechar fixtures como monkeypatch.
+import pytest
+
+# Importa el módulo principal (los stubs de dependencias se registran en conftest.py).
+import ocr_gui
+
+
+# Define un doble de las funciones de página que usa la canalización de Tesseract.
+class FakePages:
+    """Simula la detección de texto, la copia, el renderizado y el OCR externo registrando cada paso."""
+
+    # Constructor con todas las páginas escaneadas y un OCR inmediato.
+    def __init__(self) -> None:
+        # Páginas que se consideran digitales (con capa de texto).
+        self.digital: Set[int] = set()
+        # Páginas renderizadas, en orden.
+        self.rendered: List[int] = []
+        # Páginas enviadas al Tesseract externo, en orden de llegada.
+        self.ocr_calls: List[int] = []
+        # Corrutina opcional que se ejecuta antes de devolver el OCR de cada página.
+        self.delay: Optional[Callable[[int], Awaitable[None]]] = None
+
+    # Sustituto de page_has_text_layer.
+    def has_text(self, _doc: Any, pn: int) -> bool:
+        return pn in self.digital
+
+    # Sustituto de copy_page_to_pdf.
+    def copy(self, _doc: Any, pn: int) -> bytes:
+        return f"copia-{pn}".encode()
+
+    # Sustituto de render_page_to_image.
+    def render(self, _doc: Any, pn: int, _dpi: int, _grayscale: bool) -> bytes:
+        self.rendered.append(pn)
+        return str(pn).encode()
+
+    # Sustituto de tesseract_ocr_image_to_pdf.
+    async def tesseract(self, image: bytes, _lang: str, _dpi: int, _tessdata_dir: Optional[str] = None,
+                        limit_threads: bool = True) -> bytes:
+        pn = int(image)
+        self.ocr_calls.append(pn)
+        if self.delay:
+            await self.delay(pn)
+        return f"ocr-{pn}".encode()
+
+
+# Define una fixture que sustituye las funciones de página del módulo por FakePages.
+@pytest.fixture
+def fake_pages(monkeypatch: pytest.MonkeyPatch) -> FakePages:
+    """
+    Sustituye las funciones de página y desactiva el OCR integrado de PyMuPDF.
+
+    :param monkeypatch: Fixture de pytest para aplicar los reemplazos.
+    :return: Doble configurable que registra cada paso.
+    """
+    fake = FakePages()
+    monkeypatch.setattr(ocr_gui, "supports_in_process_ocr", lambda: False)
+    monkeypatch.setattr(ocr_gui, "page_has_text_layer", fake.has_text)
+    monkeypatch.setattr(ocr_gui, "copy_page_to_pdf", fake.copy)
+    monkeypatch.setattr(ocr_gui, "render_page_to_image", fake.render)
+    monkeypatch.setattr(ocr_gui, "tesseract_ocr_image_to_pdf", fake.tesseract)
+    return fake
+
+
+# Define una función que ejecuta la canalización con un límite de tiempo para detectar bloqueos.
+def run_pipeline(worker: Any, pages: List[Any]) -> Dict[int, bytes]:
+    """
+    Ejecuta _ocr_pages_async sobre un documento ficticio y falla si no termina en 5 segundos.
+
+    :param worker: OCRWorker creado con make_worker.
+    :param pages: Intervalos de páginas a procesar.
+    :return: Mapa página → PDF parcial devuelto por la canalización.
+    """
+    return asyncio.run(asyncio.wait_for(worker._ocr_pages_async(None, pages), timeout=5))
+
+
+# Define una prueba que verifica que cada página conserva su PDF aunque el OCR termine desordenado.
+def test_ocr_pages_async_asocia_cada_pagina_aunque_termine_desordenada(fake_pages: FakePages,
+                                                                        make_worker: Callable[..., Any]) -> None:
+    """Comprueba que las páginas se asocian a su PDF y que las digitales se copian sin OCR."""
+    # Hace que las primeras páginas tarden más, de modo que terminan después que las últimas.
+    async def slower_first(pn: int) -> None:
+        await asyncio.sleep(0.01 * (7 - pn))
+
+    fake_pages.delay = slower_first
+    fake_pages.digital = {4}
+
+    # Ejecuta la canalización con tres Tesseract en paralelo.
+    result = run_pipeline(make_worker(jobs=3), [(1, 6)])
+
+    # Verifica que el OCR terminó desordenado y que, aun así, cada página tiene su propio PDF.
+    assert list(result) != sorted(result)
+    assert [result[pn] for pn in sorted(result)] == [b"ocr-1", b"ocr-2", b"ocr-3", b"copia-4", b"ocr-5", b"ocr-6"]
+    # Verifica que la página digital no se renderizó ni pasó por Tesseract.
+    assert 4 not in fake_pages.rendered and 4 not in fake_pages.ocr_calls
+
+
+# Define una prueba que verifica que cada consumidor recibe su centinela y no se queda esperando.
+def test_ocr_pages_async_termina_con_mas_consumidores_que_paginas(fake_pages: FakePages,
+                                                                  make_worker: Callable[..., Any]) -> None:
+    """Comprueba que con más jobs que páginas la canalización termina sin bloquearse."""
+    # Ejecuta dos páginas con cuatro consumidores (run_pipeline falla si se bloquea).
+    result = run_pipeline(make_worker(jobs=4), [(1, 2)])
+
+    # Verifica que ambas páginas se procesaron una sola vez.
+    assert result == {1: b"ocr-1", 2: b"ocr-2"}
+    assert sorted(fake_pages.ocr_calls) == [1, 2]
+
+
+# Define una prueba que verifica que el fallo de una página detiene toda la canalización.
+def test_ocr_pages_async_cancela_el_resto_al_fallar(fake_pages: FakePages,
+                                                    make_worker: Callable[..., Any]) -> None:
+    """Comprueba que un fallo cancela al productor y a los demás consumidores y se propaga."""
+    # Páginas cuyo OCR se canceló.
+    cancelled: List[int] = []
+
+    # Hace fallar la página 2 y deja el resto esperando hasta que se cancelen.
+    async def fail_on_second(pn: int) -> None:
+        if pn == 2:
+            raise subprocess.CalledProcessError(1, ["tesseract"])
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(pn)
+            raise
+
+    fake_pages.delay = fail_on_second
+
+    # Ejecuta 40 páginas con dos consumidores y verifica que el error llega al llamador.
+    with pytest.raises(subprocess.CalledProcessError):
+        run_pipeline(make_worker(jobs=2), [(1, 40)])
+
+    # Verifica que el otro consumidor se canceló y que el productor dejó de renderizar.
+    assert cancelled == [1]
+    assert len(fake_pages.rendered) < 40
+
+
+# Define una prueba que verifica que el progreso solo se emite cuando cambia el porcentaje entero.
+def test_ocr_pages_async_emite_progreso_sin_repetir(fake_pages: FakePages,
+                                                    make_worker: Callable[..., Any]) -> None:
+    """Comprueba que 200 páginas producen un único aviso por cada porcentaje del 0 al 100."""
+    # Alterna páginas digitales y escaneadas para cubrir ambos caminos.
+    fake_pages.digital = set(range(1, 201, 2))
+    worker = make_worker(jobs=2)
+
+    # Ejecuta la canalización sobre 200 páginas.
+    run_pipeline(worker, [(1, 200)])
+
+    # Verifica que cada porcentaje se emite una sola vez y en orden.
+    assert worker.progress_signal.emitted == list(range(101))
+
+
+# Define una prueba que verifica el cambio a 'tesseract' externo si no se localizan los modelos.
+def test_ocr_pages_async_usa_tesseract_si_falla_get_tessdata(monkeypatch: pytest.MonkeyPatch, fake_pages: FakePages,
+                                                             make_worker: Callable[..., Any]) -> None:
+    """Comprueba que, si fitz.get_tessdata falla, todas las páginas van al Tesseract externo y se avisa una vez."""
+    # Páginas enviadas al OCR integrado.
+    in_process_calls: List[int] = []
+
+    # Simula un fitz con OCR integrado pero sin modelos localizables.
+    def fail_get_tessdata(_tessdata: Optional[str] = None) -> str:
+        raise RuntimeError("sin tessdata")
+
+    monkeypatch.setattr(ocr_gui, "supports_in_process_ocr", lambda: True)
+    monkeypatch.setattr(ocr_gui.fitz, "get_tessdata", fail_get_tessdata, raising=False)
+    # Fija TESSDATA_PREFIX para que la búsqueda de modelos no consulte el Tesseract del sistema.
+    monkeypatch.setenv("TESSDATA_PREFIX", "/ruta/tessdata")
+    monkeypatch.setattr(ocr_gui, "ocr_page_in_process", lambda _doc, pn, *_args: in_process_calls.append(pn))
+    worker = make_worker(jobs=1)
+
+    # Ejecuta la canalización con un solo job, que preferiría el OCR integrado.
+    result = run_pipeline(worker, [(1, 3)])
+
+    # Verifica que ninguna página usó el OCR integrado y que todas pasaron por 'tesseract'.
+    assert in_process_calls == []
+    assert result == {1: b"ocr-1", 2: b"ocr-2", 3: b"ocr-3"}
+    # Verifica que el cambio de motor se avisa una única vez.
+    assert "\n".join(worker.log_signal.emitted).count("OCR integrado de PyMuPDF no disponible") == 1
+
+
+# Define una prueba que verifica el cambio a 'tesseract' externo si falla la primera página integrada.
+def test_ocr_pages_async_usa_tesseract_si_falla_ocr_integrado(monkeypatch: pytest.MonkeyPatch, fake_pages: FakePages,
+                                                              make_worker: Callable[..., Any]) -> None:
+    """Comprueba que, tras fallar el OCR integrado, esa página y las siguientes van al Tesseract externo."""
+    # Argumentos recibidos por el OCR integrado.
+    in_process_calls: List[Tuple[Any, ...]] = []
+
+    # Simula un OCR integrado que falla al usarse.
+    def fail_in_process(_doc: Any, pn: int, *args: Any) -> bytes:
+        in_process_calls.append((pn,) + args)
+        raise RuntimeError("Tesseract integrado no disponible")
+
+    monkeypatch.setattr(ocr_gui, "supports_in_process_ocr", lambda: True)
+    monkeypatch.setattr(ocr_gui.fitz, "get_tessdata", lambda tessdata=None: "/ruta/tessdata", raising=False)
+    # Fija TESSDATA_PREFIX para que la búsqueda de modelos no consulte el Tesseract del sistema.
+    monkeypatch.setenv("TESSDATA_PREFIX", "/ruta/tessdata")
+    monkeypatch.setattr(ocr_gui, "ocr_page_in_process", fail_in_process)
+    worker = make_worker(jobs=1)
+
+    # Ejecuta la canalización con un solo job.
+    result = run_pipeline(worker, [(1, 3)])
+
+    # Verifica que el OCR integrado solo se intentó una vez, con el directorio de modelos ya resuelto.
+    assert in_process_calls == [(1, 300, True, "spa", "/ruta/tessdata")]
+    # Verifica que todas las páginas, incluida la que falló, se procesaron con 'tesseract'.
+    assert result == {1: b"ocr-1", 2: b"ocr-2", 3: b"ocr-3"}
+    assert fake_pages.ocr_calls == [1, 2, 3]
+    # Verifica que el cambio de motor se avisa una única vez.
+    assert "\n".join(worker.log_signal.emitted).count("OCR integrado de PyMuPDF no disponible") == 1
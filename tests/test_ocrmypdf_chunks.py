@@ -0,0 +1,35 @@
+# Importa el módulo principal (los stubs de dependencias se registran en conftest.py).
+import ocr_gui
+
+
+# Define una prueba que reparte un documento grande en bloques contiguos y equilibrados.
+def test_plan_ocrmypdf_chunks_reparte_documento() -> None:
+    """Comprueba que los bloques cubren todo el documento y respetan el tamaño mínimo."""
+    # Verifica el reparto equilibrado con resto absorbido por los primeros bloques.
+    assert ocr_gui.plan_ocrmypdf_chunks([(1, 250)], 250, jobs=3, min_pages=40) == [(1, 84), (85, 167), (168, 250)]
+    # Verifica que el número de bloques queda limitado por el tamaño mínimo.
+    assert ocr_gui.plan_ocrmypdf_chunks([(1, 100)], 100, jobs=8, min_pages=40) == [(1, 50), (51, 100)]
+    # Verifica que no se divide si no caben dos bloques o solo hay un proceso.
+    assert ocr_gui.plan_ocrmypdf_chunks([(1, 60)], 60, jobs=4, min_pages=40) == []
+    assert ocr_gui.plan_ocrmypdf_chunks([(1, 500)], 500, jobs=1, min_pages=40) == []
+
+
+# Define una prueba que reparte según las páginas seleccionadas y no según el tamaño del documento.
+def test_plan_ocrmypdf_chunks_sigue_la_seleccion() -> None:
+    """Comprueba que una selección pequeña no se divide y que los cortes equilibran las páginas elegidas."""
+    # Verifica que pocas páginas de un documento grande se procesan con una sola llamada.
+    assert ocr_gui.plan_ocrmypdf_chunks([(1, 10)], 500, jobs=8, min_pages=40) == []
+    assert ocr_gui.plan_ocrmypdf_chunks([(10, 20), (70, 70)], 100, jobs=8, min_pages=40) == []
+    # Verifica que cada bloque recibe la mitad de las 81 páginas elegidas y que se cubre todo el documento.
+    chunks = ocr_gui.plan_ocrmypdf_chunks([(1, 40), (200, 240)], 500, jobs=4, min_pages=40)
+    assert chunks == [(1, 200), (201, 500)]
+    assert [ocr_gui.count_pages(ocr_gui.clip_intervals([(1, 40), (200, 240)], s, e)) for s, e in chunks] == [41, 40]
+
+
+# Define una prueba que traduce la selección de páginas a la numeración de un bloque.
+def test_clip_intervals_renumera_paginas() -> None:
+    """Comprueba que los intervalos se recortan al bloque y se renumeran desde 1."""
+    # Verifica el recorte de intervalos que sobresalen por ambos lados.
+    assert ocr_gui.clip_intervals([(1, 5), (8, 12), (30, 40)], 4, 10) == [(1, 2), (5, 7)]
+    # Verifica que un bloque sin páginas seleccionadas devuelve lista vacía.
+    assert ocr_gui.clip_intervals([(1, 3)], 10, 20) == []
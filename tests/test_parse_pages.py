@@ -0,0 +1,70 @@
+# Importa pytest para verificar excepciones esperadas.
+import pytest
+
+# Importa el módulo principal (los stubs de dependencias se registran en conftest.py).
+import ocr_gui
+
+
+# Define una prueba que cubre números sueltos, rangos cerrados y rangos abiertos.
+def test_parse_pages_combina_numeros_y_rangos() -> None:
+    """Comprueba que parse_pages devuelve intervalos y usa el total para los rangos abiertos."""
+    # Verifica un rango cerrado, un número suelto y un rango abierto.
+    assert ocr_gui.parse_pages("1-3, 5, 8-", total_pages=9) == [(1, 3), (5, 5), (8, 9)]
+    # Verifica que un rango sin inicio comienza en la página 1.
+    assert ocr_gui.parse_pages("-2") == [(1, 2)]
+    # Verifica que una cadena vacía equivale a "todas las páginas".
+    assert ocr_gui.parse_pages("") == []
+
+
+# Define una prueba que cubre la normalización y la deduplicación.
+def test_parse_pages_normaliza_y_deduplica() -> None:
+    """Comprueba que los rangos invertidos se normalizan y los solapes se fusionan."""
+    # Verifica que '4-2' equivale a '2-4' y que las repeticiones desaparecen.
+    assert ocr_gui.parse_pages("4-2,3,2") == [(2, 4)]
+    # Verifica que los intervalos se ordenan y los contiguos se fusionan.
+    assert ocr_gui.parse_pages("10-12,1,2-3,13") == [(1, 3), (10, 13)]
+
+
+# Define una prueba que verifica el rechazo de formatos no válidos.
+def test_parse_pages_rechaza_formato_desconocido() -> None:
+    """Comprueba que parse_pages lanza ValueError ante fragmentos no numéricos."""
+    # Verifica que un fragmento con letras provoca error.
+    with pytest.raises(ValueError):
+        ocr_gui.parse_pages("1,a")
+
+
+# Define una prueba que verifica la conversión inversa a cadena compacta.
+def test_pages_to_ranges_acepta_paginas_e_intervalos() -> None:
+    """Comprueba que pages_to_ranges admite tanto enteros sueltos como intervalos."""
+    # Verifica la compactación de una lista de enteros desordenada.
+    assert ocr_gui.pages_to_ranges([3, 1, 2, 7]) == "1-3,7"
+    # Verifica la salida a partir de intervalos devueltos por parse_pages.
+    assert ocr_gui.pages_to_ranges(ocr_gui.parse_pages("200-,1-100,150", total_pages=250)) == "1-100,150,200-250"
+
+
+# Define una prueba que ajusta la selección de páginas al tamaño del documento.
+def test_fit_pages_to_document_recorta_y_valida() -> None:
+    """Comprueba que se descartan páginas tras la última y que la página 0 o una selección vacía fallan."""
+    # Verifica el recorte de un rango que sobrepasa el final.
+    assert ocr_gui.fit_pages_to_document([(95, 120)], total_pages=100) == [(95, 100)]
+    # Verifica que una selección dentro del documento no cambia.
+    assert ocr_gui.fit_pages_to_document([(1, 3), (5, 5)], total_pages=9) == [(1, 3), (5, 5)]
+    # Verifica que la página 0 se rechaza en lugar de interpretarse como la última.
+    with pytest.raises(RuntimeError, match="fuera de rango: 0"):
+        ocr_gui.fit_pages_to_document(ocr_gui.parse_pages("0-1", total_pages=3), total_pages=3)
+    # Verifica que falla si ninguna página seleccionada existe.
+    with pytest.raises(RuntimeError):
+        ocr_gui.fit_pages_to_document([(120, 130)], total_pages=100)
+
+
+# Define una prueba que verifica la validación de rango en los helpers que acceden a páginas.
+def test_helpers_de_pagina_rechazan_paginas_inexistentes() -> None:
+    """Comprueba que page_has_text_layer y copy_page_to_pdf no aceptan la página 0 ni pasado el final."""
+    # Usa una lista de tres elementos como documento: basta con len() para la validación.
+    doc = [object()] * 3
+    # Verifica ambos helpers con la página 0 y con una posterior a la última.
+    for pn in (0, 4):
+        with pytest.raises(RuntimeError, match="fuera de rango"):
+            ocr_gui.page_has_text_layer(doc, pn)
+        with pytest.raises(RuntimeError, match="fuera de rango"):
+            ocr_gui.copy_page_to_pdf(doc, pn)
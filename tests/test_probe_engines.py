@@ -0,0 +1,48 @@
+# Importa typing para anotar el sustituto de which.
+from typing import Optional
+
+# Importa os para construir PATH y ajustar fechas de modificación.
+import os
+
+# Importa pathlib para crear directorios temporales de prueba.
+from pathlib import Path
+
+# Importa pytest para aprovechar el fixture monkeypatch.
+import pytest
+
+# Importa el módulo principal (los stubs de dependencias se registran en conftest.py).
+import ocr_gui
+
+
+# Define una prueba que comprueba el diccionario de motores disponibles.
+def test_probe_engines_informa_de_cada_motor(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Comprueba que se marca cada motor según su presencia en PATH."""
+    # Define un which simulado en el que solo faltan 'qpdf' y Ghostscript.
+    def fake_which(name: str) -> Optional[str]:
+        return None if name == "qpdf" or name in ocr_gui.GS_CANDIDATES else f"/usr/bin/{name}"
+
+    # Sustituye la función which del módulo.
+    monkeypatch.setattr(ocr_gui, "which", fake_which)
+
+    # Verifica el estado devuelto y el orden en que se mostrará.
+    assert ocr_gui.probe_engines() == {"ocrmypdf": True, "tesseract": True, "ghostscript": False, "qpdf": False}
+
+
+# Define una prueba que verifica que la huella de PATH detecta cambios en sus directorios.
+def test_path_fingerprint_detecta_cambios(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Comprueba que instalar un ejecutable en un directorio de PATH cambia la huella."""
+    # Apunta PATH a un directorio temporal y a otro inexistente.
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    monkeypatch.setenv("PATH", os.pathsep.join([str(bin_dir), str(tmp_path / "no_existe")]))
+    # Toma la huella inicial y verifica que es estable.
+    before = ocr_gui.path_fingerprint()
+    assert before == ocr_gui.path_fingerprint()
+    assert before[1] == (str(tmp_path / "no_existe"), None)
+
+    # Simula la instalación de un ejecutable con una fecha de modificación posterior.
+    (bin_dir / "unpaper").touch()
+    os.utime(bin_dir, ns=(before[0][1] + 10**9, before[0][1] + 10**9))
+
+    # Verifica que la huella cambia.
+    assert ocr_gui.path_fingerprint() != before
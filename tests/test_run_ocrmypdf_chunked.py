@@ -0,0 +1,141 @@
+# Importa subprocess para simular el fallo de un OCRmyPDF detenido.
+import subprocess
+
+# Importa threading para coordinar los hilos de los bloques simulados.
+import threading
+
+# Importa typing para describir colecciones utilizadas en las pruebas unitarias.
+from typing import Any, Callable, Dict, List
+
+# Importa pathlib para trabajar con rutas temporales generadas por pytest.
+from pathlib import Path
+
+# Importa pytest para aprovechar fixtures como monkeypatch y tmp_path.
+import pytest
+
+# Importa el módulo principal (los stubs de dependencias se registran en conftest.py).
+import ocr_gui
+
+
+# Define un documento PyMuPDF simulado para extraer los bloques sin fitz real.
+class FakeDoc:
+    """Admite 'with', insert_pdf y save, que escribe un PDF vacío en la ruta indicada."""
+
+    # Devuelve el propio documento al entrar en el bloque 'with'.
+    def __enter__(self) -> "FakeDoc":
+        return self
+
+    # No suprime excepciones al salir del bloque 'with'.
+    def __exit__(self, *_exc: Any) -> None:
+        return None
+
+    # Ignora la copia de páginas.
+    def insert_pdf(self, *_args: Any, **_kwargs: Any) -> None:
+        return None
+
+    # Escribe un PDF mínimo para que el bloque exista en disco.
+    def save(self, path: str) -> None:
+        Path(path).write_bytes(b"%PDF-1.5")
+
+
+# Define un proceso de OCRmyPDF simulado que sigue en marcha hasta que se le detiene.
+class FakeProcess:
+    """Expone poll y terminate como subprocess.Popen."""
+
+    # Constructor que prepara el aviso de terminación.
+    def __init__(self) -> None:
+        self.terminated = threading.Event()
+
+    # Devuelve None mientras el proceso sigue en marcha.
+    def poll(self) -> Any:
+        return 0 if self.terminated.is_set() else None
+
+    # Marca el proceso como terminado.
+    def terminate(self) -> None:
+        self.terminated.set()
+
+
+# Define una fixture que prepara el PDF de entrada y sustituye la apertura de documentos.
+@pytest.fixture
+def chunk_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> List[Dict[str, Any]]:
+    """
+    Crea el PDF de entrada, simula fitz.open y registra las llamadas a merge_pdfs.
+
+    :param monkeypatch: Fixture de pytest para aplicar los reemplazos.
+    :param tmp_path: Carpeta temporal de la prueba.
+    :return: Lista donde se registran las llamadas a merge_pdfs.
+    """
+    # Crea el PDF de entrada (su tamaño decide si se usa el tmpfs).
+    (tmp_path / "entrada.pdf").write_bytes(b"%PDF-1.5")
+    monkeypatch.setattr(ocr_gui.fitz, "open", lambda *_args: FakeDoc())
+    # Registra la unión final en lugar de ejecutarla.
+    merges: List[Dict[str, Any]] = []
+    monkeypatch.setattr(ocr_gui, "merge_pdfs",
+                        lambda parts, output, template=None: merges.append(
+                            {"parts": [Path(p).name for p in parts], "output": output, "template": template}))
+    return merges
+
+
+# Define una prueba que verifica el reparto y la unión de bloques sin errores.
+def test_run_ocrmypdf_chunked_une_bloques_y_llega_al_100(monkeypatch: pytest.MonkeyPatch,
+                                                         chunk_env: List[Dict[str, Any]],
+                                                         make_worker: Callable[..., Any]) -> None:
+    """Comprueba que cada bloque recibe sus páginas locales, que el progreso ponderado llega a 100 y se une en orden."""
+    # Prepara la lista de argumentos recibidos por cada OCRmyPDF simulado.
+    calls: List[Dict[str, Any]] = []
+
+    # Define un run_ocrmypdf_cli simulado que informa de su progreso y escribe la salida.
+    def fake_run(**kwargs: Any) -> None:
+        calls.append(kwargs)
+        for value in (50, 100):
+            kwargs["progress_callback"](value)
+        Path(kwargs["output_pdf"]).write_bytes(b"%PDF-1.5")
+
+    monkeypatch.setattr(ocr_gui, "run_ocrmypdf_cli", fake_run)
+    worker = make_worker(jobs=4)
+
+    # Ejecuta dos bloques de seis páginas con una selección que los cubre parcialmente.
+    worker._run_ocrmypdf_chunked([(1, 6), (7, 12)], [(2, 6), (7, 9)], [], None)
+
+    # Verifica que cada bloque recibe la selección renumerada y la mitad de los jobs.
+    pages_by_input = {Path(c["input_pdf"]).name: c["pages"] for c in calls}
+    assert pages_by_input == {"chunk_000_in.pdf": [(2, 6)], "chunk_001_in.pdf": [(1, 3)]}
+    assert all(c["jobs"] == 2 for c in calls)
+    # Verifica que el progreso global nunca retrocede y termina en 100.
+    progress = worker.progress_signal.emitted
+    assert progress == sorted(progress) and progress[-1] == 100
+    # Verifica que los bloques se unen en orden conservando los metadatos del original.
+    assert chunk_env == [{"parts": ["chunk_000_out.pdf", "chunk_001_out.pdf"],
+                          "output": worker.output_pdf, "template": worker.input_pdf}]
+
+
+# Define una prueba que verifica que el fallo de un bloque detiene al resto y se propaga.
+def test_run_ocrmypdf_chunked_detiene_bloques_al_fallar(monkeypatch: pytest.MonkeyPatch,
+                                                        chunk_env: List[Dict[str, Any]],
+                                                        make_worker: Callable[..., Any]) -> None:
+    """Comprueba que, si un bloque falla, se termina el OCRmyPDF del otro y el error llega al llamador."""
+    # Proceso del bloque que sigue en marcha y aviso de que ya está registrado.
+    sibling = FakeProcess()
+    registered = threading.Event()
+
+    # Define un run_ocrmypdf_cli simulado: el segundo bloque espera a que lo detengan y el primero falla.
+    def fake_run(**kwargs: Any) -> None:
+        if kwargs["input_pdf"].endswith("chunk_001_in.pdf"):
+            kwargs["process_callback"](sibling)
+            registered.set()
+            # Un OCRmyPDF detenido termina con error, igual que el proceso real.
+            sibling.terminated.wait(5)
+            raise subprocess.CalledProcessError(-15, ["ocrmypdf"])
+        registered.wait(5)
+        raise RuntimeError("fallo en el bloque")
+
+    monkeypatch.setattr(ocr_gui, "run_ocrmypdf_cli", fake_run)
+    worker = make_worker(jobs=4)
+
+    # Ejecuta los bloques y verifica que se propaga el primer error.
+    with pytest.raises(RuntimeError, match="fallo en el bloque"):
+        worker._run_ocrmypdf_chunked([(1, 6), (7, 12)], [(1, 12)], [], None)
+
+    # Verifica que el otro OCRmyPDF se detuvo y que no se intentó unir el resultado.
+    assert sibling.terminated.is_set()
+    assert chunk_env == []
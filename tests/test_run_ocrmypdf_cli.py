@@ -1,255 +1,236 @@
 # Importa typing para describir colecciones utilizadas en las pruebas unitarias.
-from typing import List, Optional
-
-# Importa io para simular streams de texto en procesos fingidos.
-import io
+from typing import Callable, List, Optional
 
 # Importa pathlib para trabajar con rutas temporales generadas por pytest.
 from pathlib import Path
 
-# Importa sys para añadir la raíz del proyecto al path de importaciones.
-import sys
-
-# Importa types para crear módulos simulados cuando falten dependencias externas.
-import types
-
 # Importa pytest para aprovechar fixtures como monkeypatch y tmp_path.
 import pytest
 
-# Importa el módulo subprocess para sustituir la ejecución real de comandos externos.
+# Importa el módulo subprocess para comprobar los argumentos entregados a Popen.
 import subprocess
 
-# Crea un stub mínimo para la dependencia opcional 'fitz' si no está instalada.
-if 'fitz' not in sys.modules:
-    # Genera un módulo simulado con atributos neutros suficientes para las importaciones.
-    sys.modules['fitz'] = types.SimpleNamespace(Matrix=lambda *_args, **_kwargs: None, open=None)
-
-# Crea un stub mínimo para la dependencia opcional 'pypdf' si no está instalada.
-if 'pypdf' not in sys.modules:
-    # Define una clase ficticia que imita la interfaz básica de PdfMerger.
-    class _DummyPdfMerger:
-        # Define un método append sin comportamiento.
-        def append(self, _path: str) -> None:
-            return None
-
-        # Define un método write sin comportamiento.
-        def write(self, _fh) -> None:
-            return None
-
-        # Define un método close sin comportamiento.
-        def close(self) -> None:
-            return None
-
-    # Registra el módulo simulado con la clase ficticia.
-    sys.modules['pypdf'] = types.SimpleNamespace(PdfMerger=_DummyPdfMerger)
-
-# Crea stubs básicos para los módulos de PyQt6 en entornos de testing sin la librería instalada.
-if 'PyQt6' not in sys.modules:
-    # Construye módulo raíz vacío para PyQt6.
-    pyqt6_root = types.ModuleType('PyQt6')
-    # Construye submódulo QtCore con clases y funciones mínimas.
-    qtcore_module = types.ModuleType('PyQt6.QtCore')
-    # Construye submódulo QtWidgets con clases mínimas.
-    qtwidgets_module = types.ModuleType('PyQt6.QtWidgets')
-
-    # Define una clase de hilo ficticia compatible con herencia.
-    class _DummyThread:
-        # Constructor neutro sin argumentos obligatorios.
-        def __init__(self, *_args, **_kwargs) -> None:
-            return None
-
-    # Define una señal ficticia con métodos connect/emit sin efecto.
-    class _DummySignal:
-        # Constructor neutro.
-        def __init__(self, *_args, **_kwargs) -> None:
-            return None
-
-        # Método connect que ignora los argumentos.
-        def connect(self, *_args, **_kwargs) -> None:
-            return None
-
-        # Método emit que ignora los argumentos.
-        def emit(self, *_args, **_kwargs) -> None:
-            return None
-
-    # Define la función pyqtSignal que retorna la señal ficticia.
-    def _dummy_pyqt_signal(*_args, **_kwargs) -> _DummySignal:
-        return _DummySignal()
-
-    # Prepara el namespace Qt con atributos utilizados en el código.
-    qt_namespace = types.SimpleNamespace(
-        ItemDataRole=types.SimpleNamespace(CheckStateRole=0),
-        CheckState=types.SimpleNamespace(Checked=1)
-    )
-
-    # Asigna los símbolos necesarios al submódulo QtCore.
-    qtcore_module.Qt = qt_namespace
-    qtcore_module.QThread = _DummyThread
-    qtcore_module.pyqtSignal = _dummy_pyqt_signal
-
-    # Define una clase base vacía para los widgets.
-    class _DummyWidget:
-        # Constructor neutro.
-        def __init__(self, *_args, **_kwargs) -> None:
-            return None
-
-        # Define método setSizePolicy sin efecto.
-        def setSizePolicy(self, *_args, **_kwargs) -> None:
-            return None
-
-        # Define método clicked con atributo connect compatible.
-        @property
-        def clicked(self):
-            # Retorna un objeto con método connect sin efecto.
-            return types.SimpleNamespace(connect=lambda *_args, **_kwargs: None)
-
-        # Define método setText sin efecto.
-        def setText(self, *_args, **_kwargs) -> None:
-            return None
-
-        # Define método setChecked sin efecto.
-        def setChecked(self, *_args, **_kwargs) -> None:
-            return None
-
-        # Define método isChecked que retorna False por defecto.
-        def isChecked(self) -> bool:
-            return False
-
-        # Define método text que retorna cadena vacía.
-        def text(self) -> str:
-            return ""
-
-        # Define método append para QTextEdit simulado.
-        def append(self, *_args, **_kwargs) -> None:
-            return None
-
-    # Mapea cada clase usada en el código a la clase ficticia.
-    widget_names = [
-        'QApplication', 'QMainWindow', 'QWidget', 'QFileDialog', 'QMessageBox', 'QVBoxLayout',
-        'QHBoxLayout', 'QLabel', 'QLineEdit', 'QPushButton', 'QCheckBox', 'QSpinBox',
-        'QTextEdit', 'QProgressBar', 'QComboBox', 'QSizePolicy', 'QStyle', 'QToolButton'
-    ]
-
-    # Asigna la clase ficticia para cada identificador requerido.
-    for name in widget_names:
-        setattr(qtwidgets_module, name, _DummyWidget)
-
-    # Inserta los submódulos y el módulo raíz en sys.modules.
-    sys.modules['PyQt6'] = pyqt6_root
-    sys.modules['PyQt6.QtCore'] = qtcore_module
-    sys.modules['PyQt6.QtWidgets'] = qtwidgets_module
-
-# Añade la carpeta raíz del proyecto al sys.path para resolver importaciones relativas.
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+# Importa time para simular una consulta lenta a la ayuda de OCRmyPDF.
+import time
+
+# Importa ThreadPoolExecutor para lanzar consultas simultáneas desde varios hilos.
+from concurrent.futures import ThreadPoolExecutor
+
+# Los stubs de PyQt6 y fitz, y las fixtures fake_popen y run_cli, se definen en conftest.py.
 
 # Importa el módulo principal de la aplicación para acceder a la función bajo prueba.
 import ocr_gui
 
 
 # Define una prueba que garantiza que la limpieza se omite cuando falta 'unpaper'.
-def test_run_ocrmypdf_cli_omite_limpieza_sin_unpaper(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+def test_run_ocrmypdf_cli_omite_limpieza_sin_unpaper(monkeypatch: pytest.MonkeyPatch, fake_popen,
+                                                     run_cli: Callable[..., None]) -> None:
     """Verifica que run_ocrmypdf_cli evita '--clean' si 'unpaper' no está disponible."""
-    # Prepara una lista mutable para almacenar el comando emitido por la función.
-    captured_cmd: List[str] = []
     # Prepara una lista para recopilar los mensajes de log enviados desde run_ocrmypdf_cli.
     logs: List[str] = []
 
-    # Define un sustituto de subprocess.Popen que capture el comando sin ejecutarlo.
-    class FakeProcess:
-        # Constructor que almacena el comando y prepara un stream vacío.
-        def __init__(self, cmd, stdout, stderr, text, bufsize, universal_newlines):
-            # Registra cada elemento del comando para comprobaciones posteriores.
-            captured_cmd.extend(cmd)
-            # Expone un stream sin contenido para iterar sin errores.
-            self.stdout = io.StringIO("")
-
-        # Define wait para simular finalización correcta.
-        def wait(self) -> int:
-            return 0
-
-    # Reemplaza subprocess.Popen dentro del módulo con la clase simulada.
-    monkeypatch.setattr(ocr_gui.subprocess, "Popen", FakeProcess)
-
-    # Define un sustituto de which que retorna rutas simuladas salvo para 'unpaper'.
+    # Define un sustituto de which que emula la ausencia de 'unpaper'.
     def fake_which(name: str) -> Optional[str]:
-        # Si se solicita 'unpaper', se devuelve None para emular su ausencia.
-        if name == "unpaper":
-            return None
-        # Para el resto de dependencias, se devuelve una ruta ficticia válida.
-        return f"/usr/bin/{name}"
+        return None if name == "unpaper" else f"/usr/bin/{name}"
 
     # Reemplaza la función which del módulo por el sustituto previamente definido.
     monkeypatch.setattr(ocr_gui, "which", fake_which)
 
-    # Ejecuta la función con limpieza activada y captura el comportamiento resultante.
-    ocr_gui.run_ocrmypdf_cli(
-        input_pdf=str(tmp_path / "entrada.pdf"),
-        output_pdf=str(tmp_path / "salida.pdf"),
-        lang="spa",
-        rotate=True,
-        deskew=True,
-        clean=True,
-        jobs=2,
-        pages=[1, 2],
-        log_callback=lambda message: logs.append(message)
-    )
+    # Ejecuta la función con limpieza activada y varios jobs.
+    run_cli(rotate=True, deskew=True, clean=True, jobs=2, pages=[1, 2], log_callback=logs.append)
 
     # Comprueba que el comando no incluye las opciones '--clean' ni '--remove-background'.
-    assert "--clean" not in captured_cmd
-    assert "--remove-background" not in captured_cmd
+    assert "--clean" not in fake_popen.cmds[0]
+    assert "--remove-background" not in fake_popen.cmds[0]
     # Verifica que se registró un mensaje avisando de la ausencia de 'unpaper'.
     assert any("unpaper" in entry for entry in logs)
+    # Verifica que los Tesseract lanzados por OCRmyPDF quedan limitados a un hilo OpenMP.
+    assert fake_popen.envs[0].get("OMP_THREAD_LIMIT") == "1"
 
 
 # Define una prueba que verifica la propagación del progreso desde OCRmyPDF.
-def test_run_ocrmypdf_cli_reporta_progreso(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+def test_run_ocrmypdf_cli_reporta_progreso(fake_popen, run_cli: Callable[..., None], tmp_path: Path) -> None:
     """Comprueba que run_ocrmypdf_cli interpreta las líneas de progreso y emite porcentajes."""
-    # Prepara listas para capturar comando, logs y porcentaje de progreso.
-    captured_cmd: List[str] = []
+    # Prepara listas para capturar logs y porcentaje de progreso.
     logs: List[str] = []
     progress: List[int] = []
-
     # Genera un stream con líneas similares a las que emite OCRmyPDF.
-    sample_output = """    1: page 1 of 4\n    2: page 2 of 4\n    3: page 3 of 4\n    4: page 4 of 4\n"""
-
-    # Define un proceso simulado que produce el stream anterior.
-    class FakeProcess:
-        # Constructor que almacena el comando y ofrece el stream.
-        def __init__(self, cmd, stdout, stderr, text, bufsize, universal_newlines):
-            # Registra el comando para su inspección.
-            captured_cmd.extend(cmd)
-            # Usa StringIO para emular stdout textual línea a línea.
-            self.stdout = io.StringIO(sample_output)
-
-        # Define wait para indicar finalización correcta.
-        def wait(self) -> int:
-            return 0
-
-    # Sustituye subprocess.Popen por la clase simulada.
-    monkeypatch.setattr(ocr_gui.subprocess, "Popen", FakeProcess)
-
-    # Define un which simulado que declara disponibles todas las dependencias.
-    monkeypatch.setattr(ocr_gui, "which", lambda name: f"/usr/bin/{name}")
+    fake_popen.output = b"    1: page 1 of 4\n    2: page 2 of 4\n    3: page 3 of 4\n    4: page 4 of 4\n"
 
     # Ejecuta la función capturando logs y progreso.
-    ocr_gui.run_ocrmypdf_cli(
-        input_pdf=str(tmp_path / "entrada.pdf"),
-        output_pdf=str(tmp_path / "salida.pdf"),
-        lang="spa",
-        rotate=False,
-        deskew=False,
-        clean=False,
-        jobs=1,
-        pages=[1, 2, 3, 4],
-        log_callback=lambda message: logs.append(message),
-        progress_callback=lambda value: progress.append(value)
-    )
+    run_cli(pages=[1, 2, 3, 4], log_callback=logs.append, progress_callback=progress.append)
 
     # Asegura que el comando emitido contiene la ruta de entrada y salida esperada.
-    assert str(tmp_path / "entrada.pdf") in captured_cmd
-    assert str(tmp_path / "salida.pdf") in captured_cmd
+    assert str(tmp_path / "entrada.pdf") in fake_popen.cmds[0]
+    assert str(tmp_path / "salida.pdf") in fake_popen.cmds[0]
     # Comprueba que los logs incluyen las líneas del stream simulado.
     assert any("page 3 of 4" in entry for entry in logs)
     # Verifica que se recibió al menos un valor de progreso y que finaliza al 100%.
     assert progress, "Se esperaba recibir actualizaciones de progreso"
     assert progress[-1] == 100
+
+
+# Define una prueba que verifica que las páginas digitales se delegan en '--skip-text'.
+def test_run_ocrmypdf_cli_omite_paginas_con_texto(fake_popen, run_cli: Callable[..., None]) -> None:
+    """Comprueba que run_ocrmypdf_cli añade '--skip-text' solo cuando se solicita."""
+    # Ejecuta la función con y sin páginas digitales detectadas.
+    for skip_text in (True, False):
+        run_cli(skip_text=skip_text)
+
+    # Verifica que solo la primera ejecución incluye la opción '--skip-text'.
+    assert "--skip-text" in fake_popen.cmds[0]
+    assert "--skip-text" not in fake_popen.cmds[1]
+
+
+# Define una prueba que verifica la elección entre salida PDF/A y PDF normal.
+def test_run_ocrmypdf_cli_tipo_de_salida(fake_popen, run_cli: Callable[..., None]) -> None:
+    """Comprueba que run_ocrmypdf_cli usa '--output-type pdfa' o 'pdf' según el parámetro pdfa."""
+    # Ejecuta la función solicitando PDF/A y PDF normal.
+    for pdfa in (True, False):
+        run_cli(pdfa=pdfa)
+
+    # Verifica el valor que acompaña a '--output-type' en cada ejecución.
+    for cmd, expected in zip(fake_popen.cmds, ("pdfa", "pdf")):
+        assert cmd[cmd.index("--output-type") + 1] == expected
+
+
+# Define una prueba que verifica que OMP_THREAD_LIMIT solo se fija con varios jobs.
+def test_run_ocrmypdf_cli_limita_hilos_solo_en_paralelo(fake_popen, run_cli: Callable[..., None]) -> None:
+    """Comprueba que con un solo job no se limita OpenMP y con varios se fija OMP_THREAD_LIMIT=1."""
+    # Ejecuta la función con uno y con cuatro jobs.
+    for jobs in (1, 4):
+        run_cli(jobs=jobs)
+
+    # Verifica que solo la ejecución en paralelo limita OpenMP.
+    assert "OMP_THREAD_LIMIT" not in fake_popen.envs[0]
+    assert fake_popen.envs[1]["OMP_THREAD_LIMIT"] == "1"
+
+
+# Define una prueba que verifica la lectura por bloques de la salida binaria.
+def test_run_ocrmypdf_cli_decodifica_salida_por_bloques(fake_popen, run_cli: Callable[..., None]) -> None:
+    """Comprueba que las líneas se reconstruyen aunque un carácter UTF-8 quede partido entre lecturas."""
+    # Prepara la lista de mensajes recibidos por el log.
+    logs: List[str] = []
+    # Entrega de 5 en 5 bytes una salida cuya 'ó' queda partida y cuya última línea no tiene salto.
+    fake_popen.output = "Optimización lista\npage 2 of 2".encode("utf-8")
+    fake_popen.chunk_size = 5
+
+    # Ejecuta la función capturando el log.
+    run_cli(log_callback=logs.append)
+
+    # Verifica que ambas líneas llegan completas y bien decodificadas.
+    assert logs == ["Optimización lista", "page 2 of 2"]
+
+
+# Define una prueba que verifica que '\r' separa líneas igual que '\n'.
+def test_run_ocrmypdf_cli_separa_lineas_con_retorno_de_carro(monkeypatch: pytest.MonkeyPatch, fake_popen,
+                                                              run_cli: Callable[..., None]) -> None:
+    """Comprueba que '\r' corta líneas y que un '\r\n' partido entre lecturas no crea líneas vacías."""
+    # Prepara las listas de mensajes y porcentajes recibidos.
+    logs: List[str] = []
+    progress: List[int] = []
+    # Salida con progreso separado por '\r'; en bloques de 6 bytes el primer '\r\n' queda partido.
+    fake_popen.output = b"page 1 of 4\rPage 2 of 4\r\nHecho\r\n"
+    fake_popen.chunk_size = 6
+    # Congela el reloj para que el resultado no dependa de la velocidad de la máquina.
+    monkeypatch.setattr(ocr_gui.time, "monotonic", lambda: 1000.0)
+
+    # Ejecuta la función capturando log y progreso.
+    run_cli(log_callback=logs.append, progress_callback=progress.append)
+
+    # Verifica que cada línea llega una sola vez y que el progreso se detecta en ambas grafías.
+    assert logs == ["page 1 of 4", "Page 2 of 4", "Hecho"]
+    assert progress == [25, 50, 100]
+
+
+# Define una prueba que verifica que el progreso se limita a 10 actualizaciones por segundo.
+def test_run_ocrmypdf_cli_limita_frecuencia_de_progreso(monkeypatch: pytest.MonkeyPatch, fake_popen,
+                                                        run_cli: Callable[..., None]) -> None:
+    """Comprueba que las líneas recibidas en la misma décima de segundo solo emiten el primer valor y el 100%."""
+    # Prepara la lista de porcentajes recibidos.
+    progress: List[int] = []
+    # Genera diez líneas de progreso seguidas.
+    fake_popen.output = "".join(f"page {n} of 10\n" for n in range(1, 11)).encode("utf-8")
+    # Congela el reloj para que todas las líneas lleguen en el mismo instante.
+    monkeypatch.setattr(ocr_gui.time, "monotonic", lambda: 1000.0)
+
+    # Ejecuta la función capturando el progreso.
+    run_cli(progress_callback=progress.append)
+
+    # Verifica que solo llegan el primer valor y el 100% final, sin duplicados.
+    assert progress == [10, 100]
+
+
+# Define una prueba que verifica que el progreso retenido por la limitación no se pierde.
+def test_run_ocrmypdf_cli_entrega_progreso_retenido(monkeypatch: pytest.MonkeyPatch, fake_popen,
+                                                    run_cli: Callable[..., None]) -> None:
+    """Comprueba que el último porcentaje retenido se envía en la siguiente línea o al terminar la salida."""
+    # Prepara la lista de porcentajes recibidos.
+    progress: List[int] = []
+    # Alterna líneas de progreso rápidas con una línea normal y termina con un fallo de OCRmyPDF.
+    fake_popen.output = b"page 1 of 10\npage 3 of 10\nOptimizando\npage 5 of 10\n"
+    fake_popen.returncode = 1
+    # Simula un reloj en el que la 2ª y la 4ª línea llegan antes de cumplirse el intervalo.
+    clock = iter([1000.0, 1000.05, 1000.2, 1000.25])
+    monkeypatch.setattr(ocr_gui.time, "monotonic", lambda: next(clock))
+
+    # Ejecuta la función capturando el progreso hasta el fallo.
+    with pytest.raises(subprocess.CalledProcessError):
+        run_cli(progress_callback=progress.append)
+
+    # Verifica que el 30% llega con la línea siguiente y el 50% al agotarse la salida.
+    assert progress == [10, 30, 50]
+
+
+# Define una prueba que verifica el uso de '--tesseract-thread-limit' según la versión de OCRmyPDF.
+def test_run_ocrmypdf_cli_limita_hilos_de_tesseract_si_se_admite(fake_popen, run_cli: Callable[..., None]) -> None:
+    """Comprueba que la opción se añade con varios jobs solo si 'ocrmypdf --help' la lista, consultándola una vez."""
+    # Simula una versión de OCRmyPDF cuya ayuda incluye la opción.
+    fake_popen.help_text = "  --tesseract-thread-limit N\n"
+
+    # Ejecuta la función dos veces con varios jobs y una con un solo job.
+    for jobs in (4, 4, 1):
+        run_cli(jobs=jobs)
+
+    # Verifica que la opción acompaña solo a las ejecuciones en paralelo.
+    assert [("--tesseract-thread-limit" in cmd) for cmd in fake_popen.cmds] == [True, True, False]
+    # Verifica que la ayuda de OCRmyPDF se consultó una única vez.
+    assert fake_popen.run_calls == [["ocrmypdf", "--help"]]
+
+
+# Define una prueba que verifica que los bloques en paralelo comparten una única consulta a la ayuda.
+def test_ocrmypdf_has_option_consulta_una_vez_entre_hilos(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Comprueba que varios hilos que preguntan a la vez por una opción lanzan 'ocrmypdf --help' una sola vez."""
+    # Prepara el contador de consultas a la ayuda.
+    help_calls: List[List[str]] = []
+
+    # Define un subprocess.run lento, como el arranque real de OCRmyPDF.
+    def slow_run(cmd, **_kwargs) -> subprocess.CompletedProcess:
+        help_calls.append(list(cmd))
+        time.sleep(0.05)
+        return subprocess.CompletedProcess(cmd, 0, stdout="  --tesseract-thread-limit N\n", stderr="")
+
+    monkeypatch.setattr(ocr_gui.subprocess, "run", slow_run)
+
+    # Lanza cuatro consultas simultáneas, como los hilos de los bloques de OCRmyPDF.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        answers = list(executor.map(ocr_gui._ocrmypdf_has_option, ["--tesseract-thread-limit"] * 4))
+
+    # Verifica que todos obtienen la respuesta y que la ayuda se consultó una única vez.
+    assert answers == [True] * 4
+    assert len(help_calls) == 1
+
+
+# Define una prueba que verifica las opciones de arranque del proceso de OCRmyPDF.
+def test_run_ocrmypdf_cli_usa_opciones_de_plataforma(fake_popen, run_cli: Callable[..., None]) -> None:
+    """Comprueba que Popen recibe las opciones de SUBPROCESS_KWARGS y combina stderr con stdout."""
+    # Ejecuta la función con los valores por defecto.
+    run_cli()
+
+    # Verifica que se aplican las opciones propias de la plataforma.
+    captured_kwargs = fake_popen.calls[0]["kwargs"]
+    for key, value in ocr_gui.SUBPROCESS_KWARGS.items():
+        assert captured_kwargs[key] == value
+    # Verifica que stderr se combina con stdout para que una sola lectura drene ambos y no se llene la tubería.
+    assert captured_kwargs["stdout"] == subprocess.PIPE
+    assert captured_kwargs["stderr"] == subprocess.STDOUT
@@ -0,0 +1,13 @@
+# Importa pathlib para construir rutas de ejemplo independientes del sistema.
+from pathlib import Path
+
+# Importa el módulo principal (los stubs de dependencias se registran en conftest.py).
+import ocr_gui
+
+
+# Define una prueba que verifica la ruta de salida sugerida.
+def test_suggest_output_path_anade_sufijo_ocr(tmp_path: Path) -> None:
+    """Comprueba que la salida se propone junto a la entrada con sufijo '_OCR.pdf'."""
+    # Verifica el caso habitual y una extensión en mayúsculas.
+    assert ocr_gui.suggest_output_path(str(tmp_path / "informe.pdf")) == str(tmp_path / "informe_OCR.pdf")
+    assert ocr_gui.suggest_output_path(str(tmp_path / "scan.v2.PDF")) == str(tmp_path / "scan.v2_OCR.pdf")
@@ -0,0 +1,73 @@
+# Importa asyncio para ejecutar la corrutina bajo prueba.
+import asyncio
+
+# Importa typing para describir colecciones utilizadas en las pruebas unitarias.
+from typing import Any, Dict, List
+
+# Importa pytest para aprovechar fixtures como monkeypatch.
+import pytest
+
+# Importa el módulo principal (los stubs de dependencias se registran en conftest.py).
+import ocr_gui
+
+
+# Define una prueba que verifica que Tesseract recibe la resolución del renderizado.
+def test_tesseract_ocr_image_to_pdf_indica_dpi(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Comprueba que el comando incluye '--dpi' con la resolución indicada, que PNM no transporta."""
+    # Prepara la lista de comandos lanzados y sus argumentos con nombre.
+    captured_cmds: List[List[str]] = []
+    captured_kwargs: Dict[str, Any] = {}
+
+    # Define un proceso asíncrono simulado que devuelve un PDF mínimo.
+    class FakeAsyncProcess:
+        returncode = 0
+
+        # Devuelve la salida de Tesseract ignorando la imagen recibida.
+        async def communicate(self, _image: bytes):
+            return b"%PDF-1.5", b""
+
+    # Define un sustituto de create_subprocess_exec que registra el comando.
+    async def fake_exec(*cmd, **kwargs):
+        captured_cmds.append(list(cmd))
+        captured_kwargs.update(kwargs)
+        return FakeAsyncProcess()
+
+    # Sustituye el lanzamiento de procesos y declara presente 'tesseract'.
+    monkeypatch.setattr(ocr_gui.asyncio, "create_subprocess_exec", fake_exec)
+    monkeypatch.setattr(ocr_gui, "which", lambda name: f"/usr/bin/{name}")
+
+    # Ejecuta la corrutina con una imagen renderizada a 300 dpi.
+    result = asyncio.run(ocr_gui.tesseract_ocr_image_to_pdf(b"P5 1 1 255\n\x00", "spa", 300))
+
+    # Verifica el PDF devuelto y que la resolución acompaña a la opción '--dpi'.
+    assert result == b"%PDF-1.5"
+    cmd = captured_cmds[0]
+    assert cmd[cmd.index("--dpi") + 1] == "300"
+    # Verifica que se aplican las opciones de plataforma (sin consola en Windows).
+    for key, value in ocr_gui.SUBPROCESS_KWARGS.items():
+        assert captured_kwargs[key] == value
+
+
+# Define una prueba que verifica la búsqueda de modelos sin la shell de fitz.get_tessdata.
+def test_locate_tessdata_consulta_tesseract_sin_consola(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Comprueba que la ruta se extrae de 'tesseract --list-langs' lanzado con SUBPROCESS_KWARGS."""
+    # Prepara la lista de argumentos recibidos por subprocess.run.
+    captured: List[Dict[str, Any]] = []
+
+    # Define un subprocess.run simulado que devuelve el listado de idiomas.
+    def fake_run(cmd, **kwargs):
+        captured.append({"cmd": list(cmd), **kwargs})
+        listing = 'List of available languages in "/usr/share/tessdata/" (2):\neng\nspa\n'
+        return ocr_gui.subprocess.CompletedProcess(cmd, 0, stdout=listing, stderr="")
+
+    # Sustituye subprocess.run, declara presente 'tesseract' y elimina TESSDATA_PREFIX.
+    monkeypatch.setattr(ocr_gui.subprocess, "run", fake_run)
+    monkeypatch.setattr(ocr_gui, "which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.delenv("TESSDATA_PREFIX", raising=False)
+
+    # Verifica la ruta devuelta y que el comando se lanzó sin shell y con las opciones de plataforma.
+    assert ocr_gui.locate_tessdata() == "/usr/share/tessdata/"
+    assert captured[0]["cmd"] == ["tesseract", "--list-langs"]
+    assert "shell" not in captured[0]
+    for key, value in ocr_gui.SUBPROCESS_KWARGS.items():
+        assert captured[0][key] == value